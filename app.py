@@ -7,11 +7,13 @@ import os
 import logging
 from pathlib import Path
 
-from flask import Flask, render_template, send_from_directory
+from flask import Flask, current_app, render_template, request, send_from_directory
 from flask_cors import CORS
+from flask_compress import Compress
 
-from config import get_config, STATIC_DIR, TEMPLATES_DIR
-from src.api.routes import api_bp
+from config import get_config, ensure_dirs, STATIC_DIR, TEMPLATES_DIR
+from src.api.routes import api_bp, init_predictor
+from src.api.json_provider import OrjsonProvider
 
 # Configure logging
 logging.basicConfig(
@@ -43,67 +45,91 @@ def create_app(config=None):
 
     app.config.from_object(config)
 
+    # Create data/model/report directories (once per process)
+    ensure_dirs()
+
+    # Chart styling changes matplotlib's global defaults, so it is applied
+    # here once rather than as a side effect of the first chart or report
+    from src.utils.visualizations import setup_plot_style
+    setup_plot_style()
+
+    # Serialize JSON responses with orjson
+    app.json = OrjsonProvider(app)
+
     # Enable CORS
     CORS(app, resources={
         r"/api/*": {
             "origins": "*",
             "methods": ["GET", "POST", "OPTIONS"],
-            "allow_headers": ["Content-Type"]
+            "allow_headers": ["Content-Type"],
+            "max_age": 86400
         }
     })
 
+    @app.before_request
+    def short_circuit_preflight():
+        """Answer API preflight requests before blueprint dispatch."""
+        if request.method == "OPTIONS" and request.path.startswith("/api/"):
+            return "", 204
+
+    # Compress large JSON and static responses
+    Compress(app)
+
     # Register blueprints
     app.register_blueprint(api_bp)
 
+    # Load the model up front instead of on the first prediction
+    init_predictor(app)
+
     # Register routes
     register_routes(app)
 
-    logger.info(f"ValorVista application initialized (Debug: {app.debug})")
+    logger.info("ValorVista application initialized (Debug: %s)", app.debug)
 
     return app
 
 
+# Page URL -> (endpoint, template)
+_PAGES = {
+    "/": ("index", "index.html"),
+    "/batch": ("batch", "batch.html"),
+    "/insights": ("insights", "insights.html"),
+    "/about": ("about", "about.html"),
+}
+
+
+def render_page(template: str):
+    """Render a static application page."""
+    return render_template(template)
+
+
+def favicon():
+    """Serve favicon."""
+    return send_from_directory(
+        current_app.static_folder, "images/favicon.ico",
+        mimetype="image/vnd.microsoft.icon"
+    )
+
+
+def not_found(error):
+    """Handle 404 errors."""
+    return render_template("404.html"), 404
+
+
+def server_error(error):
+    """Handle 500 errors."""
+    logger.error("Server error: %s", error)
+    return render_template("500.html"), 500
+
+
 def register_routes(app):
     """Register main application routes."""
+    for rule, (endpoint, template) in _PAGES.items():
+        app.add_url_rule(rule, endpoint, render_page, defaults={"template": template})
 
-    @app.route("/")
-    def index():
-        """Render main application page."""
-        return render_template("index.html")
-
-    @app.route("/batch")
-    def batch():
-        """Render batch processing page."""
-        return render_template("batch.html")
-
-    @app.route("/insights")
-    def insights():
-        """Render market insights page."""
-        return render_template("insights.html")
-
-    @app.route("/about")
-    def about():
-        """Render about page."""
-        return render_template("about.html")
-
-    @app.route("/favicon.ico")
-    def favicon():
-        """Serve favicon."""
-        return send_from_directory(
-            app.static_folder, "images/favicon.ico",
-            mimetype="image/vnd.microsoft.icon"
-        )
-
-    @app.errorhandler(404)
-    def not_found(error):
-        """Handle 404 errors."""
-        return render_template("404.html"), 404
-
-    @app.errorhandler(500)
-    def server_error(error):
-        """Handle 500 errors."""
-        logger.error(f"Server error: {error}")
-        return render_template("500.html"), 500
+    app.add_url_rule("/favicon.ico", "favicon", favicon)
+    app.register_error_handler(404, not_found)
+    app.register_error_handler(500, server_error)
 
 
 # Create application instance
@@ -113,5 +139,5 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     host = os.environ.get("HOST", "0.0.0.0")
 
-    logger.info(f"Starting ValorVista on {host}:{port}")
+    logger.info("Starting ValorVista on %s:%s", host, port)
     app.run(host=host, port=port, debug=True)
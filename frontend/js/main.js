@@ -148,6 +148,22 @@ const API = {
         });
     },
 
+    async waitForReport(reportId, interval = 1000, maxAttempts = 60) {
+        for (let attempt = 0; attempt < maxAttempts; attempt++) {
+            const result = await this.request(`/report/status/${reportId}`);
+
+            if (result.status === 'ready') {
+                return result;
+            }
+            if (result.status === 'failed') {
+                throw new Error(result.error || 'Report generation failed');
+            }
+
+            await new Promise(resolve => setTimeout(resolve, interval));
+        }
+        throw new Error('Report generation timed out');
+    },
+
     async healthCheck() {
         return this.request('/health');
     }
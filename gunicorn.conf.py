@@ -0,0 +1,30 @@
+"""
+Gunicorn Configuration for ValorVista
+Sizes the worker pool from the available CPUs so slow prediction and
+report requests do not queue behind health checks.
+"""
+
+import multiprocessing
+import os
+
+# Server socket
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Worker processes: threaded workers keep lightweight endpoints responsive
+# while CPU-bound predictions occupy other threads/processes.
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# Load the app (and model) once in the master so workers share its pages
+preload_app = True
+
+# Timeouts
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+# Logging
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info")
@@ -0,0 +1,45 @@
+"""
+JSON Provider for ValorVista.
+Serializes API responses with orjson instead of the stdlib encoder.
+"""
+
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    orjson encodes numpy arrays and scalars natively, so prediction
+    results can be returned without converting them to Python types first.
+    """
+
+    OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        return self.dumpb(obj, **kwargs).decode("utf-8")
+
+    def dumpb(self, obj: Any, **kwargs: Any) -> bytes:
+        """Serialize data as JSON bytes."""
+        option = self.OPTIONS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys"):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Serialize the arguments and wrap them in a JSON response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self.dumpb(obj, indent=indent), mimetype=self.mimetype
+        )
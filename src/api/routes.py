@@ -5,49 +5,169 @@ Defines all REST endpoints for the application.
 
 import os
 import uuid
+import hashlib
 import logging
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from flask import Blueprint, request, jsonify, current_app, send_file
+from flask import Blueprint, request, jsonify, current_app, send_from_directory
+from werkzeug.exceptions import NotFound
+import orjson
 import pandas as pd
+from cachetools import TTLCache
 import numpy as np
 
 from src.models import HousePricePredictor
 from src.api.validators import PropertyInput, BatchInput
 from src.utils.report_generator import ReportGenerator
+from src.utils.persistence import read_model_version
 from pydantic import ValidationError
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 api_bp = Blueprint("api", __name__, url_prefix="/api/v1")
 
-# Global predictor instance (initialized on first request)
-_predictor = None
+# Browser cache lifetime for generated reports (seconds)
+REPORT_MAX_AGE = 3600
+
+# Reports are generated off the request thread
+_report_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="report"
+)
+# Jobs are kept only long enough to be polled; pending and finished
+# reports are still found on disk after their entry expires
+REPORT_JOB_TTL = 600
+_report_jobs: TTLCache = TTLCache(maxsize=1024, ttl=REPORT_JOB_TTL)
+_report_jobs_lock = threading.Lock()
+# Pending markers older than this belong to builds that died with their
+# worker (killed or timed out) and are reported as failed
+REPORT_BUILD_TIMEOUT = 300
+
+# Guards predictor (re)loading so concurrent requests load the model once
+_predictor_lock = threading.Lock()
+# (load key, predictor) of the model being served, swapped as one reference
+# so requests can read it without taking the lock
+_active_predictor: Dict[str, Optional[tuple]] = {"entry": None}
+
+
+@lru_cache(maxsize=1)
+def _load_predictor(
+    model_path: str,
+    processor_path: str,
+    model_version: Optional[str],
+    cache_size: int,
+    batch_size: int,
+    batch_wait_ms: float,
+    device: str,
+    gpu_min_batch: int
+) -> HousePricePredictor:
+    """
+    Load a predictor for a specific version of the model files.
+
+    The model's version stamp is part of the cache key, so retraining the
+    model on disk swaps in a fresh predictor without a restart.
+    """
+    return HousePricePredictor(
+        model_path=Path(model_path),
+        processor_path=Path(processor_path),
+        cache_size=cache_size,
+        batch_size=batch_size,
+        batch_wait_ms=batch_wait_ms,
+        device=device,
+        gpu_min_batch=gpu_min_batch
+    )
+
+
+def _predictor_for(config) -> HousePricePredictor:
+    """
+    Return the predictor for the model files named in a config.
+
+    The trainer writes the version stamp after both the model and the
+    processor, so a new predictor is only loaded once the pair is complete.
+    Models saved without a stamp are loaded once and not reloaded. While the
+    stamp is unchanged, requests return the active predictor without locking.
+    """
+    model_path = config["MODEL_PATH"]
+    settings = (
+        str(model_path),
+        str(config["PREPROCESSOR_PATH"]),
+        config["PREDICTION_CACHE_SIZE"],
+        config["PREDICTION_BATCH_SIZE"],
+        config["PREDICTION_BATCH_WAIT_MS"],
+        config["PREDICTION_DEVICE"],
+        config["PREDICTION_GPU_MIN_BATCH"]
+    )
+
+    # Fast path: one stamp read, no lock, while the model is unchanged
+    entry = _active_predictor["entry"]
+    if entry is not None and entry[0] == (settings, read_model_version(model_path)):
+        return entry[1]
+
+    with _predictor_lock:
+        if not (os.path.exists(model_path) and os.path.exists(settings[1])):
+            raise RuntimeError("Model is not available. Train the model first.")
+
+        while True:
+            version = read_model_version(model_path)
+            predictor = _load_predictor(
+                settings[0], settings[1], version, *settings[2:]
+            )
+            # A retrain finishing mid-load may have mixed files from two
+            # versions; load again under the new stamp in that case
+            if read_model_version(model_path) == version:
+                break
+
+        # Release the replaced predictor's batching thread (and its model)
+        previous = _active_predictor["entry"]
+        if previous is not None and previous[1] is not predictor:
+            previous[1].close()
+        _active_predictor["entry"] = ((settings, version), predictor)
+        return predictor
+
+
+def init_predictor(app) -> None:
+    """
+    Load the predictor when the application starts.
+
+    Loading at startup keeps the model unpickling off the first request and,
+    with a preloading server, lets forked workers share the loaded arrays.
+
+    Args:
+        app: Flask application whose config names the model files.
+    """
+    try:
+        _predictor_for(app.config)
+    except Exception as e:
+        logger.warning("Predictor not loaded at startup: %s", e)
 
 
 def get_predictor() -> HousePricePredictor:
-    """Get or initialize the predictor instance."""
-    global _predictor
-    if _predictor is None:
-        from config import Config
-        _predictor = HousePricePredictor(
-            model_path=Config.MODEL_PATH,
-            processor_path=Config.PREPROCESSOR_PATH
-        )
-    return _predictor
+    """Get the predictor for the current model files."""
+    return _predictor_for(current_app.config)
+
+
+# Serialized health body, rebuilt at most once per second
+_HEALTH: Dict[str, Any] = {"ts": 0.0, "body": b""}
 
 
 @api_bp.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "1.0.0"
-    })
+    now = time.time()
+    if now - _HEALTH["ts"] >= 1.0:
+        _HEALTH["body"] = orjson.dumps({
+            "status": "healthy",
+            "timestamp": datetime.fromtimestamp(now, tz=timezone.utc).isoformat(),
+            "version": "1.0.0"
+        })
+        _HEALTH["ts"] = now
+    return current_app.response_class(_HEALTH["body"], mimetype="application/json")
 
 
 @api_bp.route("/predict", methods=["POST"])
@@ -98,7 +218,7 @@ def predict():
         })
 
     except Exception as e:
-        logger.error(f"Prediction error: {e}")
+        logger.error("Prediction error: %s", e)
         return jsonify({
             "success": False,
             "error": str(e)
@@ -114,44 +234,50 @@ def predict_batch():
     Returns predictions for all properties with statistics.
     """
     try:
-        data = request.get_json()
+        body = request.get_data()
 
-        if not data or "properties" not in data:
+        if not body:
             return jsonify({
                 "success": False,
                 "error": "No properties provided"
             }), 400
 
-        # Validate batch input
+        # Parse and validate the raw body in one pass
         try:
-            validated = BatchInput(**data)
+            properties = BatchInput.model_validate_json(body).properties
         except ValidationError as e:
             return jsonify({
                 "success": False,
                 "error": "Validation error",
-                "details": e.errors()
+                "details": e.errors(include_input=False)
             }), 400
 
-        # Convert to model inputs
-        model_inputs = [prop.to_model_input() for prop in validated.properties]
+        # Build a single model input frame
+        batch_df = pd.DataFrame([prop.to_model_input() for prop in properties])
 
         # Get predictions
         predictor = get_predictor()
-        results = predictor.predict_batch(model_inputs)
+        results = predictor.predict_batch(batch_df)
 
-        # Calculate summary statistics
-        predictions = [r["prediction"] for r in results]
+        # Calculate summary statistics from a single array
+        predictions = np.fromiter(
+            (r["prediction"] for r in results), dtype=np.float64, count=len(results)
+        )
+        mean = float(predictions.mean())
+        median = float(np.median(predictions))
+        low = float(predictions.min())
+        high = float(predictions.max())
         summary = {
             "count": len(predictions),
-            "mean": np.mean(predictions),
-            "median": np.median(predictions),
-            "min": np.min(predictions),
-            "max": np.max(predictions),
-            "std": np.std(predictions),
+            "mean": mean,
+            "median": median,
+            "min": low,
+            "max": high,
+            "std": float(predictions.std()),
             "formatted": {
-                "mean": f"${np.mean(predictions):,.0f}",
-                "median": f"${np.median(predictions):,.0f}",
-                "range": f"${np.min(predictions):,.0f} - ${np.max(predictions):,.0f}"
+                "mean": f"${mean:,.0f}",
+                "median": f"${median:,.0f}",
+                "range": f"${low:,.0f} - ${high:,.0f}"
             }
         }
 
@@ -163,7 +289,7 @@ def predict_batch():
         })
 
     except Exception as e:
-        logger.error(f"Batch prediction error: {e}")
+        logger.error("Batch prediction error: %s", e)
         return jsonify({
             "success": False,
             "error": str(e)
@@ -207,7 +333,7 @@ def explain_prediction():
         })
 
     except Exception as e:
-        logger.error(f"Explanation error: {e}")
+        logger.error("Explanation error: %s", e)
         return jsonify({
             "success": False,
             "error": str(e)
@@ -228,19 +354,130 @@ def get_feature_importance():
         })
 
     except Exception as e:
-        logger.error(f"Feature importance error: {e}")
+        logger.error("Feature importance error: %s", e)
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+CHART_MIME_TYPES = {"svg": "image/svg+xml", "png": "image/png", "webp": "image/webp"}
+
+
+@api_bp.route("/chart/feature-importance.<image_format>", methods=["GET"])
+def get_feature_importance_chart(image_format: str):
+    """
+    Serve the feature importance chart as an image file.
+
+    The raw SVG/PNG/WebP bytes are returned directly, so pages can reference
+    the chart by URL instead of inlining a base64 data URI.
+    """
+    if image_format not in CHART_MIME_TYPES:
+        return jsonify({
+            "success": False,
+            "error": "Unsupported chart format"
+        }), 404
+
+    try:
+        top_n = request.args.get("top_n", 10, type=int)
+        predictor = get_predictor()
+
+        # Imported here so matplotlib only loads once a chart is requested
+        from src.utils.visualizations import create_feature_importance_chart
+        image = create_feature_importance_chart(
+            predictor.get_feature_importance(top_n),
+            top_n=top_n,
+            return_base64=False,
+            image_format=image_format
+        )
+
+        response = current_app.response_class(
+            image, mimetype=CHART_MIME_TYPES[image_format]
+        )
+        response.set_etag(hashlib.blake2b(image, digest_size=8).hexdigest())
+        return response.make_conditional(request)
+
+    except Exception as e:
+        logger.error("Feature importance chart error: %s", e)
         return jsonify({
             "success": False,
             "error": str(e)
         }), 500
 
 
+def _report_filename(report_id: str) -> str:
+    """Return the PDF filename for a report ID."""
+    return f"valuation_report_{report_id}.pdf"
+
+
+def _staging_path(report_path: Path) -> Path:
+    """Return the in-progress location for a report."""
+    return report_path.parent / ".partial" / report_path.name
+
+
+def _error_path(report_path: Path) -> Path:
+    """Return the file recording why a report failed."""
+    staging_path = _staging_path(report_path)
+    return staging_path.with_name(f"{staging_path.name}.error")
+
+
+def _build_report(
+    predictor: HousePricePredictor,
+    model_input: Dict[str, Any],
+    report_path: Path
+) -> Path:
+    """
+    Run the valuation and render the PDF report.
+
+    The PDF is written to a staging directory first and moved into place
+    when complete, so downloads never see a partially written file. A
+    failure is recorded next to the staging file, so every worker can
+    report it.
+
+    Args:
+        predictor: Loaded predictor instance.
+        model_input: Validated property features.
+        report_path: Final location of the report.
+
+    Returns:
+        Path to the generated report.
+    """
+    staging_path = _staging_path(report_path)
+    try:
+        prediction_result = predictor.predict(model_input)
+        explanation = predictor.explain_prediction(model_input)
+        feature_importance = predictor.get_feature_importance(10)
+
+        ReportGenerator().generate_report(
+            property_data=model_input,
+            prediction=prediction_result,
+            explanation=explanation,
+            feature_importance=feature_importance,
+            output_path=staging_path
+        )
+        os.replace(staging_path, report_path)
+    except Exception as e:
+        _error_path(report_path).write_text(str(e) or type(e).__name__)
+        raise
+    finally:
+        staging_path.unlink(missing_ok=True)
+    return report_path
+
+
+def _log_report_failure(report_id: str, future: Future) -> None:
+    """Log errors raised by a background report job."""
+    error = future.exception()
+    if error is not None:
+        logger.error("Report generation error (%s): %s", report_id, error)
+
+
 @api_bp.route("/report", methods=["POST"])
 def generate_report():
     """
     Generate PDF report for property valuation.
 
-    Returns URL to download the generated report.
+    The report is built in the background; the response returns
+    immediately with URLs to poll its status and download it.
     """
     try:
         data = request.get_json()
@@ -262,144 +499,235 @@ def generate_report():
                 "details": e.errors()
             }), 400
 
-        # Get prediction and explanation
         predictor = get_predictor()
-        prediction_result = predictor.predict(model_input)
-        explanation = predictor.explain_prediction(model_input)
-        feature_importance = predictor.get_feature_importance(10)
+        report_id = uuid.uuid4().hex[:8]
+        report_filename = _report_filename(report_id)
+        report_path = current_app.config["REPORTS_DIR"] / report_filename
 
-        # Generate report
-        report_generator = ReportGenerator()
-        report_id = str(uuid.uuid4())[:8]
-        report_filename = f"valuation_report_{report_id}.pdf"
+        # Mark the report as pending (visible to every worker), then queue it
+        staging_path = _staging_path(report_path)
+        staging_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path.touch()
 
-        from config import Config
-        report_path = Config.REPORTS_DIR / report_filename
-
-        report_generator.generate_report(
-            property_data=model_input,
-            prediction=prediction_result,
-            explanation=explanation,
-            feature_importance=feature_importance,
-            output_path=report_path
-        )
+        try:
+            future = _report_executor.submit(
+                _build_report, predictor, model_input, report_path
+            )
+        except Exception:
+            staging_path.unlink(missing_ok=True)
+            raise
+        future.add_done_callback(partial(_log_report_failure, report_id))
+        with _report_jobs_lock:
+            _report_jobs[report_id] = future
 
         return jsonify({
             "success": True,
             "report_id": report_id,
+            "status": "pending",
+            "status_url": f"/api/v1/report/status/{report_id}",
             "download_url": f"/api/v1/report/download/{report_filename}"
-        })
+        }), 202
 
     except Exception as e:
-        logger.error(f"Report generation error: {e}")
+        logger.error("Report generation error: %s", e)
         return jsonify({
             "success": False,
             "error": str(e)
         }), 500
 
 
+def _report_error(report_path: Path) -> Optional[str]:
+    """
+    Return why a report failed in any worker, if it did.
+
+    Args:
+        report_path: Final location of the report.
+
+    Returns:
+        The recorded error, a timeout message for a build abandoned by its
+        worker, or None while the report is pending or was never requested.
+    """
+    try:
+        return _error_path(report_path).read_text() or "Report generation failed"
+    except FileNotFoundError:
+        pass
+    try:
+        started = _staging_path(report_path).stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if time.time() - started > REPORT_BUILD_TIMEOUT:
+        return "Report generation timed out"
+    return None
+
+
+@api_bp.route("/report/status/<report_id>", methods=["GET"])
+def report_status(report_id: str):
+    """Get the generation status of a report."""
+    if not report_id.isalnum():
+        return jsonify({
+            "success": False,
+            "error": "Report not found"
+        }), 404
+
+    report_filename = _report_filename(report_id)
+    with _report_jobs_lock:
+        future = _report_jobs.get(report_id)
+        finished = future is not None and future.done()
+        if finished:
+            # Finished jobs are answered from disk from now on
+            del _report_jobs[report_id]
+
+    report_path = current_app.config["REPORTS_DIR"] / report_filename
+    if finished:
+        error = future.exception()
+    elif future is None and not report_path.exists():
+        # Built by another worker, or by one that no longer exists
+        error = _report_error(report_path)
+    else:
+        error = None
+    if error is not None:
+        return jsonify({
+            "success": False,
+            "report_id": report_id,
+            "status": "failed",
+            "error": str(error)
+        })
+
+    if report_path.exists():
+        status = "ready"
+    elif future is not None or _staging_path(report_path).exists():
+        status = "pending"
+    else:
+        return jsonify({
+            "success": False,
+            "error": "Report not found"
+        }), 404
+
+    return jsonify({
+        "success": True,
+        "report_id": report_id,
+        "status": status,
+        "download_url": f"/api/v1/report/download/{report_filename}"
+    })
+
+
 @api_bp.route("/report/download/<filename>", methods=["GET"])
 def download_report(filename: str):
     """Download generated report."""
+    # send_from_directory rejects traversal and 404s on missing files itself
     try:
-        from config import Config
-        report_path = Config.REPORTS_DIR / filename
-
-        if not report_path.exists():
-            return jsonify({
-                "success": False,
-                "error": "Report not found"
-            }), 404
-
-        return send_file(
-            report_path,
+        return send_from_directory(
+            current_app.config["REPORTS_DIR"],
+            filename,
             mimetype="application/pdf",
             as_attachment=True,
-            download_name=filename
+            download_name=filename,
+            conditional=True,
+            max_age=REPORT_MAX_AGE
         )
-
-    except Exception as e:
-        logger.error(f"Report download error: {e}")
+    except NotFound:
         return jsonify({
             "success": False,
-            "error": str(e)
-        }), 500
+            "error": "Report not found"
+        }), 404
+
+
+NEIGHBORHOODS = [
+    "Blmngtn", "Blueste", "BrDale", "BrkSide", "ClearCr",
+    "CollgCr", "Crawfor", "Edwards", "Gilbert", "IDOTRR",
+    "MeadowV", "Mitchel", "NAmes", "NoRidge", "NPkVill",
+    "NridgHt", "NWAmes", "OldTown", "SWISU", "Sawyer",
+    "SawyerW", "Somerst", "StoneBr", "Timber", "Veenker"
+]
+
+FORM_OPTIONS = {
+    "buildingTypes": [
+        {"value": "1Fam", "label": "Single-family Detached"},
+        {"value": "2FmCon", "label": "Two-family Conversion"},
+        {"value": "Duplx", "label": "Duplex"},
+        {"value": "TwnhsE", "label": "Townhouse End Unit"},
+        {"value": "TwnhsI", "label": "Townhouse Inside Unit"}
+    ],
+    "houseStyles": [
+        {"value": "1Story", "label": "One Story"},
+        {"value": "1.5Fin", "label": "One and Half Story Finished"},
+        {"value": "1.5Unf", "label": "One and Half Story Unfinished"},
+        {"value": "2Story", "label": "Two Story"},
+        {"value": "2.5Fin", "label": "Two and Half Story Finished"},
+        {"value": "2.5Unf", "label": "Two and Half Story Unfinished"},
+        {"value": "SFoyer", "label": "Split Foyer"},
+        {"value": "SLvl", "label": "Split Level"}
+    ],
+    "qualityRatings": [
+        {"value": 1, "label": "1 - Very Poor"},
+        {"value": 2, "label": "2 - Poor"},
+        {"value": 3, "label": "3 - Fair"},
+        {"value": 4, "label": "4 - Below Average"},
+        {"value": 5, "label": "5 - Average"},
+        {"value": 6, "label": "6 - Above Average"},
+        {"value": 7, "label": "7 - Good"},
+        {"value": 8, "label": "8 - Very Good"},
+        {"value": 9, "label": "9 - Excellent"},
+        {"value": 10, "label": "10 - Very Excellent"}
+    ],
+    "exteriorQuality": [
+        {"value": "Ex", "label": "Excellent"},
+        {"value": "Gd", "label": "Good"},
+        {"value": "TA", "label": "Typical/Average"},
+        {"value": "Fa", "label": "Fair"},
+        {"value": "Po", "label": "Poor"}
+    ],
+    "garageTypes": [
+        {"value": "Attchd", "label": "Attached to Home"},
+        {"value": "Detchd", "label": "Detached from Home"},
+        {"value": "BuiltIn", "label": "Built-In"},
+        {"value": "CarPort", "label": "Car Port"},
+        {"value": "Basment", "label": "Basement Garage"},
+        {"value": "2Types", "label": "More than One Type"},
+        {"value": "NA", "label": "No Garage"}
+    ],
+    "foundations": [
+        {"value": "PConc", "label": "Poured Concrete"},
+        {"value": "CBlock", "label": "Cinder Block"},
+        {"value": "BrkTil", "label": "Brick & Tile"},
+        {"value": "Stone", "label": "Stone"},
+        {"value": "Wood", "label": "Wood"},
+        {"value": "Slab", "label": "Slab"}
+    ]
+}
+
+# Static responses are serialized once at import and served with an ETag
+STATIC_MAX_AGE = 86400
+
+_NEIGHBORHOODS_BODY = orjson.dumps({
+    "success": True,
+    "neighborhoods": NEIGHBORHOODS
+})
+_NEIGHBORHOODS_ETAG = hashlib.blake2b(_NEIGHBORHOODS_BODY, digest_size=8).hexdigest()
+
+_OPTIONS_BODY = orjson.dumps({
+    "success": True,
+    "options": FORM_OPTIONS
+})
+_OPTIONS_ETAG = hashlib.blake2b(_OPTIONS_BODY, digest_size=8).hexdigest()
+
+
+def _static_json_response(body: bytes, etag: str):
+    """Build a cacheable JSON response, answering 304 on a matching ETag."""
+    response = current_app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_MAX_AGE
+    return response.make_conditional(request)
 
 
 @api_bp.route("/neighborhoods", methods=["GET"])
 def get_neighborhoods():
     """Get list of valid neighborhoods."""
-    neighborhoods = [
-        "Blmngtn", "Blueste", "BrDale", "BrkSide", "ClearCr",
-        "CollgCr", "Crawfor", "Edwards", "Gilbert", "IDOTRR",
-        "MeadowV", "Mitchel", "NAmes", "NoRidge", "NPkVill",
-        "NridgHt", "NWAmes", "OldTown", "SWISU", "Sawyer",
-        "SawyerW", "Somerst", "StoneBr", "Timber", "Veenker"
-    ]
-    return jsonify({
-        "success": True,
-        "neighborhoods": neighborhoods
-    })
+    return _static_json_response(_NEIGHBORHOODS_BODY, _NEIGHBORHOODS_ETAG)
 
 
 @api_bp.route("/options", methods=["GET"])
 def get_form_options():
     """Get all form options for the frontend."""
-    return jsonify({
-        "success": True,
-        "options": {
-            "buildingTypes": [
-                {"value": "1Fam", "label": "Single-family Detached"},
-                {"value": "2FmCon", "label": "Two-family Conversion"},
-                {"value": "Duplx", "label": "Duplex"},
-                {"value": "TwnhsE", "label": "Townhouse End Unit"},
-                {"value": "TwnhsI", "label": "Townhouse Inside Unit"}
-            ],
-            "houseStyles": [
-                {"value": "1Story", "label": "One Story"},
-                {"value": "1.5Fin", "label": "One and Half Story Finished"},
-                {"value": "1.5Unf", "label": "One and Half Story Unfinished"},
-                {"value": "2Story", "label": "Two Story"},
-                {"value": "2.5Fin", "label": "Two and Half Story Finished"},
-                {"value": "2.5Unf", "label": "Two and Half Story Unfinished"},
-                {"value": "SFoyer", "label": "Split Foyer"},
-                {"value": "SLvl", "label": "Split Level"}
-            ],
-            "qualityRatings": [
-                {"value": 1, "label": "1 - Very Poor"},
-                {"value": 2, "label": "2 - Poor"},
-                {"value": 3, "label": "3 - Fair"},
-                {"value": 4, "label": "4 - Below Average"},
-                {"value": 5, "label": "5 - Average"},
-                {"value": 6, "label": "6 - Above Average"},
-                {"value": 7, "label": "7 - Good"},
-                {"value": 8, "label": "8 - Very Good"},
-                {"value": 9, "label": "9 - Excellent"},
-                {"value": 10, "label": "10 - Very Excellent"}
-            ],
-            "exteriorQuality": [
-                {"value": "Ex", "label": "Excellent"},
-                {"value": "Gd", "label": "Good"},
-                {"value": "TA", "label": "Typical/Average"},
-                {"value": "Fa", "label": "Fair"},
-                {"value": "Po", "label": "Poor"}
-            ],
-            "garageTypes": [
-                {"value": "Attchd", "label": "Attached to Home"},
-                {"value": "Detchd", "label": "Detached from Home"},
-                {"value": "BuiltIn", "label": "Built-In"},
-                {"value": "CarPort", "label": "Car Port"},
-                {"value": "Basment", "label": "Basement Garage"},
-                {"value": "2Types", "label": "More than One Type"},
-                {"value": "NA", "label": "No Garage"}
-            ],
-            "foundations": [
-                {"value": "PConc", "label": "Poured Concrete"},
-                {"value": "CBlock", "label": "Cinder Block"},
-                {"value": "BrkTil", "label": "Brick & Tile"},
-                {"value": "Stone", "label": "Stone"},
-                {"value": "Wood", "label": "Wood"},
-                {"value": "Slab", "label": "Slab"}
-            ]
-        }
-    })
+    return _static_json_response(_OPTIONS_BODY, _OPTIONS_ETAG)
@@ -4,20 +4,7 @@ Uses Pydantic for robust input validation.
 """
 
 from typing import Optional, List, Any
-from pydantic import BaseModel, Field, field_validator
-from enum import Enum
-
-
-class MSZoning(str, Enum):
-    """Zoning classification."""
-    A = "A"
-    C = "C"
-    FV = "FV"
-    I = "I"
-    RH = "RH"
-    RL = "RL"
-    RP = "RP"
-    RM = "RM"
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class PropertyInput(BaseModel):
@@ -94,33 +81,31 @@ class PropertyInput(BaseModel):
     SaleType: Optional[str] = Field("WD", description="Sale type")
     SaleCondition: Optional[str] = Field("Normal", description="Sale condition")
 
-    class Config:
-        populate_by_name = True
-
-    @field_validator("YearRemodAdd", mode="before")
-    @classmethod
-    def set_remod_year(cls, v, info):
-        """Set remodel year to build year if not provided."""
-        if v is None and "YearBuilt" in info.data:
-            return info.data["YearBuilt"]
-        return v
-
-    @field_validator("GarageYrBlt", mode="before")
-    @classmethod
-    def set_garage_year(cls, v, info):
-        """Set garage year to build year if not provided."""
-        if v is None and "YearBuilt" in info.data:
-            return info.data["YearBuilt"]
-        return v
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+    @model_validator(mode="after")
+    def set_default_years(self) -> "PropertyInput":
+        """Set remodel and garage years to build year if not provided."""
+        if self.YearRemodAdd is None:
+            self.YearRemodAdd = self.YearBuilt
+        if self.GarageYrBlt is None:
+            self.GarageYrBlt = self.YearBuilt
+        return self
 
     def to_model_input(self) -> dict:
         """Convert to dictionary format expected by model."""
-        data = self.model_dump(by_alias=True)
-        # Handle None values
-        for key, value in data.items():
-            if value is None:
-                data[key] = 0
-        return data
+        # Read attributes directly; missing values become 0
+        return {
+            alias: 0 if (value := getattr(self, name)) is None else value
+            for name, alias in _FIELDS
+        }
+
+
+# (attribute, model column) pairs, resolved once instead of per dump
+_FIELDS = tuple(
+    (name, field.alias or name)
+    for name, field in PropertyInput.model_fields.items()
+)
 
 
 class BatchInput(BaseModel):
@@ -1,6 +1,7 @@
 """Model module for ValorVista."""
 
+from .batcher import DynamicBatcher
 from .predictor import HousePricePredictor
 from .trainer import ModelTrainer
 
-__all__ = ["HousePricePredictor", "ModelTrainer"]
+__all__ = ["DynamicBatcher", "HousePricePredictor", "ModelTrainer"]
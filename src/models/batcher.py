@@ -0,0 +1,147 @@
+"""
+Dynamic Batching Module for ValorVista.
+Groups concurrent single-item requests into one model call.
+"""
+
+import os
+import queue
+import threading
+import time
+import logging
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Queue marker telling the worker thread to exit
+_STOP = object()
+
+
+class DynamicBatcher:
+    """
+    Collects items submitted from many threads and processes them together.
+
+    The first pending item starts a batch; the batch is closed when it
+    reaches max_batch_size or max_wait_ms has passed, whichever is first.
+    Each caller gets a Future resolved with its own result. If a batch
+    fails, its items are retried one at a time so that only the failing
+    items get the error.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            process_batch: Function mapping a list of items to a list of
+                results in the same order.
+            max_batch_size: Maximum number of items per batch.
+            max_wait_ms: Longest time to wait for a batch to fill.
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._lock = threading.Lock()
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._closed = False
+
+    def submit(self, item: Any) -> Future:
+        """
+        Queue an item for the next batch.
+
+        Args:
+            item: Item to process.
+
+        Returns:
+            Future resolved with the item's result.
+        """
+        future: Future = Future()
+        with self._lock:
+            if not self._closed:
+                self._ensure_worker().put((item, future))
+                return future
+
+        # Closed batchers process items in the caller's thread
+        self._process([(item, future)])
+        return future
+
+    def close(self) -> None:
+        """
+        Stop the worker thread after the items already queued.
+
+        The worker holds process_batch (typically a bound method of its
+        owner), so owners that are being discarded should close their
+        batcher to release both. Items submitted later are still processed,
+        one at a time in the submitting thread.
+        """
+        with self._lock:
+            self._closed = True
+            if self._worker is not None and self._pid == os.getpid():
+                self._queue.put(_STOP)
+            self._worker = None
+
+    def _ensure_worker(self) -> queue.Queue:
+        """Start the worker thread, restarting it in forked processes."""
+        # Called with self._lock held. Threads do not survive fork, so
+        # each process needs its own
+        if self._pid != os.getpid() or not self._worker.is_alive():
+            self._queue = queue.Queue()
+            self._worker = threading.Thread(
+                target=self._run, args=(self._queue,),
+                name="prediction-batcher", daemon=True
+            )
+            self._worker.start()
+            self._pid = os.getpid()
+        return self._queue
+
+    def _run(self, pending: queue.Queue) -> None:
+        """Worker loop: gather a batch, process it, resolve its futures."""
+        while True:
+            first = pending.get()
+            if first is _STOP:
+                return
+
+            batch: List[Tuple[Any, Future]] = [first]
+            stop = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stop = True
+                    break
+                batch.append(entry)
+
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[Tuple[Any, Future]]) -> None:
+        """Process a batch and resolve its futures, isolating failed items."""
+        try:
+            results = self.process_batch([item for item, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error("Batch item failed: %s", e)
+                batch[0][1].set_exception(e)
+                return
+            # One bad item must not fail the requests that shared its batch
+            logger.warning("Batch of %d failed, retrying items singly: %s", len(batch), e)
+            for entry in batch:
+                self._process([entry])
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
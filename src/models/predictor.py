@@ -3,18 +3,42 @@ Prediction Module for ValorVista.
 Handles model loading and inference with uncertainty estimation.
 """
 
+import hashlib
+import threading
+from itertools import repeat
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Any, Union
 from pathlib import Path
 import joblib
 import logging
+import orjson
+from cachetools import LRUCache
+from scipy.special import ndtri
 
 from src.preprocessing import DataProcessor
+from src.utils.persistence import model_importance_path
+from .batcher import DynamicBatcher
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Two-sided z-scores by confidence level
+_Z_CACHE: Dict[float, float] = {}
+
+
+def _z_for(confidence: float) -> float:
+    """Return the two-sided normal z-score for a confidence level."""
+    z = _Z_CACHE.get(confidence)
+    if z is None:
+        z = _Z_CACHE[confidence] = float(ndtri((1 + confidence) / 2))
+    return z
+
+
+def _format_prices(values: np.ndarray) -> List[str]:
+    """Format prices as whole dollars, e.g. "$189,267"."""
+    # Round in numpy (half to even, like "{:,.0f}") and format ints
+    return [f"${v:,}" for v in np.rint(values).astype(np.int64).tolist()]
+
 
 class HousePricePredictor:
     """
@@ -25,7 +49,12 @@ class HousePricePredictor:
     def __init__(
         self,
         model_path: Optional[Path] = None,
-        processor_path: Optional[Path] = None
+        processor_path: Optional[Path] = None,
+        cache_size: int = 4096,
+        batch_size: int = 32,
+        batch_wait_ms: float = 5.0,
+        device: str = "cpu",
+        gpu_min_batch: int = 32
     ):
         """
         Initialize predictor with model and processor paths.
@@ -33,10 +62,31 @@ class HousePricePredictor:
         Args:
             model_path: Path to saved model file.
             processor_path: Path to saved processor file.
+            cache_size: Number of single-property results to keep cached.
+            batch_size: Maximum number of concurrent single-property
+                predictions run as one model call (1 disables batching).
+            batch_wait_ms: Longest time a single prediction waits for
+                others to join its batch.
+            device: "cuda" runs large-batch point predictions with cuML's
+                Forest Inference Library when available; "cpu" otherwise.
+            gpu_min_batch: Smallest number of rows sent to the GPU; by
+                default a full coalesced batch of single predictions.
         """
         self.model = None
+        self.device = device
+        self.gpu_min_batch = gpu_min_batch
+        self._gpu_model = None
         self.processor = DataProcessor()
         self.model_loaded = False
+        self._sorted_importance: List[Tuple[str, float]] = []
+        self._importance_pct: Dict[str, str] = {}
+        self._cache: LRUCache = LRUCache(maxsize=cache_size)
+        self._cache_lock = threading.Lock()
+        self._batcher: Optional[DynamicBatcher] = None
+        if batch_size > 1:
+            self._batcher = DynamicBatcher(
+                self._predict_records, batch_size, batch_wait_ms
+            )
 
         if model_path and processor_path:
             self.load(model_path, processor_path)
@@ -50,18 +100,97 @@ class HousePricePredictor:
             processor_path: Path to saved processor.
         """
         try:
-            logger.info(f"Loading model from {model_path}")
-            self.model = joblib.load(model_path)
+            # Memory-map the model's arrays: pages load lazily and are
+            # shared between worker processes through the page cache
+            logger.info("Loading model from %s", model_path)
+            self.model = joblib.load(model_path, mmap_mode="r")
 
-            logger.info(f"Loading processor from {processor_path}")
+            logger.info("Loading processor from %s", processor_path)
             self.processor.load(processor_path)
 
+            # Importances are fixed once loaded, so sort them only once
+            self._sorted_importance = sorted(
+                zip(
+                    self.processor.get_feature_names(),
+                    self._load_importances(model_path).tolist()
+                ),
+                key=lambda item: item[1],
+                reverse=True
+            )
+            # Percentages shown in explanations and reports, formatted in one pass
+            names = [feature for feature, _ in self._sorted_importance]
+            values = np.array([importance for _, importance in self._sorted_importance]) * 100
+            self._importance_pct = dict(zip(names, np.char.mod("%.1f%%", values).tolist()))
+
+            self._gpu_model = self._load_gpu_model() if self.device == "cuda" else None
+
             self.model_loaded = True
+            with self._cache_lock:
+                self._cache.clear()
             logger.info("Model and processor loaded successfully")
         except Exception as e:
-            logger.error(f"Error loading model: {e}")
+            logger.error("Error loading model: %s", e)
             raise
 
+    def _load_importances(self, model_path: Path) -> np.ndarray:
+        """
+        Load the feature importances saved with a model.
+
+        Models trained before importances were saved separately fall back
+        to the estimator's own feature_importances_.
+
+        Args:
+            model_path: Path of the loaded model.
+
+        Returns:
+            Importance per feature.
+        """
+        importance_path = model_importance_path(model_path)
+        if importance_path.exists():
+            return np.asarray(joblib.load(importance_path))
+        return self.model.feature_importances_
+
+    def close(self) -> None:
+        """
+        Stop the background batching thread.
+
+        The predictor stays usable; single predictions are then run
+        without batching.
+        """
+        if self._batcher is not None:
+            self._batcher.close()
+
+    def _load_gpu_model(self):
+        """
+        Convert the loaded model for GPU inference with cuML FIL.
+
+        Returns:
+            ForestInference model, or None when cuML is unavailable or the
+            model cannot be converted (predictions then stay on CPU).
+        """
+        try:
+            from cuml import ForestInference
+            return ForestInference.load_from_sklearn(self.model, output_class=False)
+        except Exception as e:
+            logger.warning("GPU inference unavailable, using CPU: %s", e)
+            return None
+
+    def _uses_gpu(self, n_rows: int) -> bool:
+        """Return whether a batch of this many rows is predicted on the GPU."""
+        return self._gpu_model is not None and n_rows >= self.gpu_min_batch
+
+    def _predict_log(self, X: np.ndarray) -> np.ndarray:
+        """Predict log-scale prices, on the GPU for large batches."""
+        if self._uses_gpu(X.shape[0]):
+            try:
+                preds = self._gpu_model.predict(X)
+                # cuML may return a CuPy array; copy it back to host memory
+                preds = preds.get() if hasattr(preds, "get") else np.asarray(preds)
+                return preds.astype(np.float64).ravel()
+            except Exception as e:
+                logger.warning("GPU prediction failed, using CPU: %s", e)
+        return self.model.predict(X)
+
     def predict(
         self,
         data: Union[Dict[str, Any], pd.DataFrame],
@@ -82,26 +211,100 @@ class HousePricePredictor:
         if not self.model_loaded:
             raise ValueError("Model not loaded. Call load() first.")
 
-        # Convert dict to DataFrame if needed
+        # Single properties are served from the cache when seen before.
+        # Results are cached serialized, so every caller gets its own copy
+        # and mutating a result never changes what later callers see
         if isinstance(data, dict):
-            df = pd.DataFrame([data])
-        else:
-            df = data.copy()
+            key = self._cache_key(data, return_interval, confidence)
+            with self._cache_lock:
+                cached = self._cache.get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+
+            if self._batcher is not None:
+                result = self._batcher.submit(
+                    (data, return_interval, confidence)
+                ).result()
+            else:
+                result = self._predict_frame(
+                    pd.DataFrame([data]), return_interval, confidence
+                )
+            cached = orjson.dumps(result)
+            with self._cache_lock:
+                self._cache[key] = cached
+            return result
+
+        # transform never modifies its input, so the frame is used as is
+        return self._predict_frame(data, return_interval, confidence)
+
+    @staticmethod
+    def _cache_key(
+        data: Dict[str, Any],
+        return_interval: bool,
+        confidence: float
+    ) -> bytes:
+        """Build a stable hash of the prediction inputs."""
+        payload = orjson.dumps(
+            [data, return_interval, confidence],
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _predict_records(
+        self,
+        requests: List[Tuple[Dict[str, Any], bool, float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Predict a batch of queued single-property requests.
 
+        Requests sharing the same interval options run as one model call;
+        the combined result is split back into one result per request.
+
+        Args:
+            requests: (data, return_interval, confidence) tuples.
+
+        Returns:
+            Single-property results in request order.
+        """
+        groups: Dict[Tuple[bool, float], List[int]] = {}
+        for i, (_, return_interval, confidence) in enumerate(requests):
+            groups.setdefault((return_interval, confidence), []).append(i)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        for (return_interval, confidence), indices in groups.items():
+            df = pd.DataFrame([requests[i][0] for i in indices])
+            combined = self._predict_frame(df, return_interval, confidence)
+            for row, i in enumerate(indices):
+                result = {
+                    "predictions": [combined["predictions"][row]],
+                    "formatted_predictions": [combined["formatted_predictions"][row]]
+                }
+                if return_interval:
+                    result["prediction_intervals"] = [combined["prediction_intervals"][row]]
+                    result["confidence_level"] = confidence
+                results[i] = result
+
+        return results
+
+    def _predict_frame(
+        self,
+        df: pd.DataFrame,
+        return_interval: bool,
+        confidence: float
+    ) -> Dict[str, Any]:
+        """Run the model on a DataFrame of property features."""
         # Transform features
         X = self.processor.transform(df)
 
         # Make predictions (model predicts in log scale)
-        log_predictions = self.model.predict(X)
+        log_predictions = self._predict_log(X)
 
         # Convert back to original scale
         predictions = np.expm1(log_predictions)
 
         result = {
             "predictions": predictions.tolist(),
-            "formatted_predictions": [
-                f"${p:,.0f}" for p in predictions
-            ]
+            "formatted_predictions": _format_prices(predictions)
         }
 
         if return_interval:
@@ -122,7 +325,7 @@ class HousePricePredictor:
         """
         Calculate prediction intervals using model variance estimation.
 
-        Uses staged predictions to estimate variance across trees.
+        Uses the spread of the late boosting stages to estimate variance.
 
         Args:
             X: Transformed features.
@@ -132,79 +335,149 @@ class HousePricePredictor:
         Returns:
             List of interval dictionaries.
         """
-        intervals = []
-
-        # Use staged predictions to estimate uncertainty
-        staged_preds = np.array(list(self.model.staged_predict(X)))
-
-        for i in range(X.shape[0]):
-            # Get predictions at each stage for this sample
-            sample_staged = staged_preds[:, i]
-
-            # Calculate variance from staged predictions
-            # Use last 50% of stages for stability
-            n_stages = len(sample_staged)
-            stable_preds = sample_staged[n_stages // 2:]
-            pred_std = np.std(stable_preds)
-
-            # Add base uncertainty (model can't be more precise than ~5%)
-            base_uncertainty = 0.05 * np.abs(log_predictions[i])
-            total_std = np.sqrt(pred_std ** 2 + base_uncertainty ** 2)
-
-            # Calculate z-score for confidence level
-            from scipy import stats
-            z = stats.norm.ppf((1 + confidence) / 2)
-
-            # Calculate intervals in log scale
-            lower_log = log_predictions[i] - z * total_std
-            upper_log = log_predictions[i] + z * total_std
-
-            # Convert to original scale
-            lower = np.expm1(lower_log)
-            upper = np.expm1(upper_log)
-            point_estimate = np.expm1(log_predictions[i])
-
-            intervals.append({
-                "lower": float(lower),
-                "upper": float(upper),
-                "point_estimate": float(point_estimate),
+        pred_std = self._staged_std(X, log_predictions)
+
+        # Add base uncertainty (model can't be more precise than ~5%)
+        base_uncertainty = 0.05 * np.abs(log_predictions)
+        total_std = np.sqrt(pred_std ** 2 + base_uncertainty ** 2)
+
+        # Calculate z-score for confidence level
+        z = _z_for(confidence)
+
+        # Calculate intervals in log scale and convert to original scale
+        lower = np.expm1(log_predictions - z * total_std)
+        upper = np.expm1(log_predictions + z * total_std)
+        point_estimate = np.expm1(log_predictions)
+
+        return [
+            {
+                "lower": lo,
+                "upper": up,
+                "point_estimate": pt,
                 "formatted": {
-                    "lower": f"${lower:,.0f}",
-                    "upper": f"${upper:,.0f}",
-                    "point_estimate": f"${point_estimate:,.0f}"
+                    "lower": lo_fmt,
+                    "upper": up_fmt,
+                    "point_estimate": pt_fmt
                 }
-            })
+            }
+            for lo, up, pt, lo_fmt, up_fmt, pt_fmt in zip(
+                lower.tolist(), upper.tolist(), point_estimate.tolist(),
+                _format_prices(lower), _format_prices(upper),
+                _format_prices(point_estimate)
+            )
+        ]
 
-        return intervals
+    def _staged_std(
+        self,
+        X: np.ndarray,
+        log_predictions: np.ndarray
+    ) -> np.ndarray:
+        """
+        Standard deviation of the last 50% of staged predictions.
+
+        Each stage differs from the next by one scaled tree, so the tail
+        stages are recovered by walking back from the final prediction.
+        Only the trees in the tail are evaluated and the statistics are
+        accumulated with Welford's algorithm, without storing the stages.
+
+        Args:
+            X: Transformed features.
+            log_predictions: Final log-scale predictions.
+
+        Returns:
+            Per-sample standard deviation across the tail stages.
+        """
+        # Models without individual trees (e.g. histogram boosting)
+        if not hasattr(self.model, "estimators_"):
+            return self._staged_predict_std(X)
+
+        # FIL sums the trees in float32; walk back from sklearn's own sum so
+        # every recovered stage is one of sklearn's staged predictions
+        if self._uses_gpu(X.shape[0]):
+            log_predictions = self.model.predict(X)
+
+        estimators = self.model.estimators_
+        learning_rate = self.model.learning_rate
+        n_stages = estimators.shape[0]
+        start = n_stages // 2
+
+        # Trees are evaluated on float32 inputs (a no-op for transform output)
+        X32 = np.ascontiguousarray(X, dtype=np.float32)
+
+        staged = np.array(log_predictions, dtype=np.float64)
+        mean = staged.copy()
+        m2 = np.zeros_like(staged)
+        for count, stage in enumerate(range(n_stages - 1, start, -1), start=2):
+            staged -= learning_rate * estimators[stage, 0].tree_.predict(X32)[:, 0]
+            delta = staged - mean
+            mean += delta / count
+            m2 += delta * (staged - mean)
+
+        return np.sqrt(m2 / (n_stages - start))
+
+    def _staged_predict_std(self, X: np.ndarray) -> np.ndarray:
+        """
+        Standard deviation of the last 50% of stages via staged_predict.
+
+        Args:
+            X: Transformed features.
+
+        Returns:
+            Per-sample standard deviation across the tail stages.
+        """
+        n_stages = self.model.n_iter_
+        start = n_stages // 2
+        stable_preds = np.empty((n_stages - start, X.shape[0]), dtype=np.float32)
+
+        # Skip the early stages, then fill the buffer with the tail
+        stages = self.model.staged_predict(X)
+        for _ in range(start):
+            next(stages)
+        for row, staged in enumerate(stages):
+            stable_preds[row] = staged
+
+        # Store float32 but accumulate the spread in float64
+        return stable_preds.std(axis=0, dtype=np.float64)
 
     def predict_batch(
         self,
-        data: List[Dict[str, Any]],
+        data: Union[List[Dict[str, Any]], pd.DataFrame],
         return_interval: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Make predictions for multiple properties.
 
         Args:
-            data: List of property feature dictionaries.
+            data: List of property feature dictionaries, or a DataFrame
+                with one row per property.
             return_interval: Whether to return prediction intervals.
 
         Returns:
             List of prediction results.
         """
-        df = pd.DataFrame(data)
+        if isinstance(data, pd.DataFrame):
+            df = data
+            data = df.to_dict("records")
+        else:
+            df = pd.DataFrame(data)
         result = self.predict(df, return_interval=return_interval)
 
         # Format as list of individual results
         batch_results = []
-        for i in range(len(data)):
+        intervals = result.get("prediction_intervals") if return_interval else None
+        for item, prediction, formatted, interval in zip(
+            data,
+            result["predictions"],
+            result["formatted_predictions"],
+            repeat(None) if intervals is None else intervals
+        ):
             item_result = {
-                "input": data[i],
-                "prediction": result["predictions"][i],
-                "formatted_prediction": result["formatted_predictions"][i]
+                "input": item,
+                "prediction": prediction,
+                "formatted_prediction": formatted
             }
-            if return_interval and "prediction_intervals" in result:
-                item_result["interval"] = result["prediction_intervals"][i]
+            if intervals is not None:
+                item_result["interval"] = interval
             batch_results.append(item_result)
 
         return batch_results
@@ -222,21 +495,11 @@ class HousePricePredictor:
         if not self.model_loaded:
             raise ValueError("Model not loaded.")
 
-        feature_names = self.processor.get_feature_names()
-        importances = self.model.feature_importances_
-
-        n_features = min(len(feature_names), len(importances))
-
-        importance_list = [
-            {"feature": feature_names[i], "importance": float(importances[i])}
-            for i in range(n_features)
+        return [
+            {"feature": feature, "importance": importance}
+            for feature, importance in self._sorted_importance[:top_n]
         ]
 
-        # Sort by importance
-        importance_list.sort(key=lambda x: x["importance"], reverse=True)
-
-        return importance_list[:top_n]
-
     def explain_prediction(
         self,
         data: Dict[str, Any],
@@ -265,7 +528,8 @@ class HousePricePredictor:
                 key_factors.append({
                     "feature": feature_name,
                     "value": data[feature_name],
-                    "importance": feat["importance"]
+                    "importance": feat["importance"],
+                    "importance_pct": self._importance_pct[feature_name]
                 })
 
         return {
@@ -287,16 +551,16 @@ class HousePricePredictor:
         for factor in key_factors[:5]:
             name = factor["feature"]
             value = factor["value"]
-            importance = factor["importance"] * 100
+            importance = factor["importance_pct"]
 
             # Format based on feature type
             if name in ["GrLivArea", "TotalBsmtSF", "1stFlrSF", "2ndFlrSF"]:
-                lines.append(f"- {name}: {value:,} sq ft ({importance:.1f}% importance)")
+                lines.append(f"- {name}: {value:,} sq ft ({importance} importance)")
             elif name in ["OverallQual", "OverallCond"]:
-                lines.append(f"- {name}: {value}/10 ({importance:.1f}% importance)")
+                lines.append(f"- {name}: {value}/10 ({importance} importance)")
             elif "Year" in name:
-                lines.append(f"- {name}: {value} ({importance:.1f}% importance)")
+                lines.append(f"- {name}: {value} ({importance} importance)")
             else:
-                lines.append(f"- {name}: {value} ({importance:.1f}% importance)")
+                lines.append(f"- {name}: {value} ({importance} importance)")
 
         return "\n".join(lines)
@@ -3,10 +3,12 @@ Model Training Module for ValorVista.
 Handles training, hyperparameter tuning, and model evaluation.
 """
 
+import importlib.util
 import numpy as np
 import pandas as pd
 from typing import Dict, Tuple, Optional, List, Any
-from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor
+from sklearn.inspection import permutation_importance
 from sklearn.model_selection import (
     train_test_split, cross_val_score, GridSearchCV, KFold
 )
@@ -14,13 +16,15 @@ from sklearn.metrics import (
     mean_squared_error, mean_absolute_error, r2_score,
     mean_absolute_percentage_error
 )
-import joblib
+from joblib import Parallel, delayed
 from pathlib import Path
 import logging
 
 from src.preprocessing import DataProcessor
+from src.utils.persistence import (
+    atomic_dump, model_importance_path, write_model_version
+)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -30,17 +34,28 @@ class ModelTrainer:
     Uses Gradient Boosting with hyperparameter tuning.
     """
 
+    # Supported model types
+    MODEL_TYPES = {
+        "gradient_boosting": GradientBoostingRegressor,
+        "hist_gradient_boosting": HistGradientBoostingRegressor,
+    }
+
     def __init__(self, config: Optional[Dict] = None):
         """
         Initialize trainer with configuration.
 
         Args:
-            config: Model configuration dictionary.
+            config: Model configuration dictionary. "model_type" selects
+                the estimator ("hist_gradient_boosting" by default).
         """
         self.config = config or {}
+        self.model_type = self.config.get("model_type", "hist_gradient_boosting")
+        if self.model_type not in self.MODEL_TYPES:
+            raise ValueError(f"Unknown model type: {self.model_type}")
         self.model = None
         self.processor = DataProcessor()
         self.metrics: Dict[str, float] = {}
+        self.importances: Optional[np.ndarray] = None
         self.feature_importance: Optional[pd.DataFrame] = None
 
     def train(
@@ -62,8 +77,8 @@ class ModelTrainer:
         Returns:
             Dictionary of evaluation metrics.
         """
-        logger.info(f"Loading training data from {data_path}")
-        df = pd.read_csv(data_path)
+        logger.info("Loading training data from %s", data_path)
+        df = self._read_training_data(data_path)
 
         # Prepare target variable
         if "SalePrice" not in df.columns:
@@ -91,7 +106,7 @@ class ModelTrainer:
 
         # Train final model
         logger.info("Training final model with best parameters")
-        self.model = GradientBoostingRegressor(**best_params)
+        self.model = self._build_model(best_params)
         self.model.fit(X_train, y_train)
 
         # Evaluate model
@@ -99,24 +114,93 @@ class ModelTrainer:
         self.metrics = self._evaluate(X_val, y_val)
 
         # Calculate feature importance
+        if hasattr(self.model, "feature_importances_"):
+            self.importances = self.model.feature_importances_
+        else:
+            self.importances = self._permutation_importances(X_val, y_val)
         self._calculate_feature_importance()
 
-        # Save model and processor
-        logger.info(f"Saving model to {model_save_path}")
-        joblib.dump(self.model, model_save_path)
+        # Save model and processor; files are replaced, never rewritten in
+        # place, because serving processes may have them memory-mapped
+        logger.info("Saving model to %s", model_save_path)
+        atomic_dump(self.model, model_save_path)
 
-        logger.info(f"Saving processor to {processor_save_path}")
+        atomic_dump(self.importances, model_importance_path(model_save_path))
+
+        logger.info("Saving processor to %s", processor_save_path)
         self.processor.save(processor_save_path)
 
+        # Stamp the pair last; serving processes reload when the stamp changes
+        write_model_version(model_save_path)
+
         # Log metrics
         logger.info("Training completed. Metrics:")
         for metric, value in self.metrics.items():
-            logger.info(f"  {metric}: {value:.4f}")
+            logger.info("  %s: %.4f", metric, value)
 
         return self.metrics
 
+    @staticmethod
+    def _read_training_data(data_path: Path) -> pd.DataFrame:
+        """
+        Read the training CSV with numeric columns typed up front.
+
+        Declaring the numeric dtypes skips type inference for them, and the
+        multithreaded pyarrow parser is used when pyarrow is installed.
+
+        Args:
+            data_path: Path to training data CSV.
+
+        Returns:
+            Training DataFrame.
+        """
+        dtype = {col: np.float32 for col in DataProcessor.NUMERIC_FEATURES}
+        engine = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+        return pd.read_csv(data_path, engine=engine, dtype=dtype)
+
+    def _build_model(self, params: Dict[str, Any]):
+        """Create an unfitted estimator of the configured type."""
+        return self.MODEL_TYPES[self.model_type](**params)
+
+    def _permutation_importances(self, X_val: np.ndarray, y_val: np.ndarray) -> np.ndarray:
+        """
+        Estimate importances for models without built-in ones.
+
+        Histogram gradient boosting has no impurity-based importances, so
+        they are estimated on the validation set and normalized to sum to 1
+        like feature_importances_.
+
+        Args:
+            X_val: Validation features.
+            y_val: Validation target (log-transformed).
+
+        Returns:
+            Normalized importance per feature.
+        """
+        result = permutation_importance(
+            self.model, X_val, y_val,
+            n_repeats=5, random_state=42, n_jobs=-1
+        )
+        importances = np.clip(result.importances_mean, 0, None)
+        total = importances.sum()
+        if total > 0:
+            importances = importances / total
+        return importances
+
     def _get_default_params(self) -> Dict[str, Any]:
         """Get default model parameters."""
+        if self.model_type == "hist_gradient_boosting":
+            return {
+                "max_iter": 500,
+                "learning_rate": 0.05,
+                "max_depth": 5,
+                "l2_regularization": 0.0,
+                "random_state": 42,
+                "early_stopping": True,
+                "validation_fraction": 0.1,
+                "n_iter_no_change": 20,
+                "tol": 1e-4
+            }
         return {
             "n_estimators": 500,
             "learning_rate": 0.05,
@@ -146,19 +230,27 @@ class ModelTrainer:
         Returns:
             Best parameters dictionary.
         """
-        param_grid = {
-            "n_estimators": [300, 500],
-            "learning_rate": [0.05, 0.1],
-            "max_depth": [4, 5, 6],
-            "min_samples_split": [5, 10],
-            "min_samples_leaf": [2, 4],
-            "subsample": [0.8, 0.9],
-        }
-
-        base_model = GradientBoostingRegressor(
-            random_state=42,
-            max_features="sqrt"
-        )
+        if self.model_type == "hist_gradient_boosting":
+            param_grid = {
+                "max_iter": [300, 500],
+                "learning_rate": [0.05, 0.1],
+                "max_depth": [4, 5, 6],
+                "min_samples_leaf": [10, 20],
+                "l2_regularization": [0.0, 1.0],
+            }
+            fixed_params = {"random_state": 42}
+        else:
+            param_grid = {
+                "n_estimators": [300, 500],
+                "learning_rate": [0.05, 0.1],
+                "max_depth": [4, 5, 6],
+                "min_samples_split": [5, 10],
+                "min_samples_leaf": [2, 4],
+                "subsample": [0.8, 0.9],
+            }
+            fixed_params = {"random_state": 42, "max_features": "sqrt"}
+
+        base_model = self._build_model(fixed_params)
 
         cv = KFold(n_splits=5, shuffle=True, random_state=42)
 
@@ -173,18 +265,19 @@ class ModelTrainer:
 
         grid_search.fit(X, y)
 
-        logger.info(f"Best CV Score: {-grid_search.best_score_:.4f}")
-        logger.info(f"Best Parameters: {grid_search.best_params_}")
+        logger.info("Best CV Score: %.4f", -grid_search.best_score_)
+        logger.info("Best Parameters: %s", grid_search.best_params_)
 
         # Combine with fixed parameters
         best_params = {
             **grid_search.best_params_,
-            "random_state": 42,
-            "max_features": "sqrt",
+            **fixed_params,
             "validation_fraction": 0.1,
             "n_iter_no_change": 20,
             "tol": 1e-4
         }
+        if self.model_type == "hist_gradient_boosting":
+            best_params["early_stopping"] = True
 
         return best_params
 
@@ -215,7 +308,7 @@ class ModelTrainer:
         # Cross-validation score
         cv_scores = cross_val_score(
             self.model, X_val, y_val,
-            cv=5, scoring="neg_root_mean_squared_error"
+            cv=5, scoring="neg_root_mean_squared_error", n_jobs=-1
         )
 
         return {
@@ -229,11 +322,11 @@ class ModelTrainer:
 
     def _calculate_feature_importance(self) -> None:
         """Calculate and store feature importance."""
-        if self.model is None:
+        if self.importances is None:
             return
 
         feature_names = self.processor.get_feature_names()
-        importances = self.model.feature_importances_
+        importances = self.importances
 
         # Handle case where feature count differs
         n_features = min(len(feature_names), len(importances))
@@ -276,28 +369,54 @@ class ModelTrainer:
         """
         cv = KFold(n_splits=n_splits, shuffle=True, random_state=42)
 
-        scores = {
-            "rmse": [],
-            "mae": [],
-            "r2": []
+        # Folds are independent, so fit them in parallel
+        model_cls = self.MODEL_TYPES[self.model_type]
+        params = self._get_default_params()
+        fold_scores = Parallel(n_jobs=-1)(
+            delayed(self._fit_fold)(
+                model_cls, params, X[train_idx], y[train_idx], X[val_idx], y[val_idx]
+            )
+            for train_idx, val_idx in cv.split(X)
+        )
+        scores = dict(zip(("rmse", "mae", "r2"), zip(*fold_scores)))
+
+        return {
+            f"cv_{metric}_mean": np.mean(values)
+            for metric, values in scores.items()
         }
 
-        for train_idx, val_idx in cv.split(X):
-            X_train, X_val = X[train_idx], X[val_idx]
-            y_train, y_val = y[train_idx], y[val_idx]
+    @staticmethod
+    def _fit_fold(
+        model_cls: type,
+        params: Dict[str, Any],
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: np.ndarray,
+        y_val: np.ndarray
+    ) -> Tuple[float, float, float]:
+        """
+        Fit and score a model on one cross-validation fold.
 
-            model = GradientBoostingRegressor(**self._get_default_params())
-            model.fit(X_train, y_train)
+        Args:
+            model_cls: Estimator class to fit.
+            params: Model parameters.
+            X_train: Fold training features.
+            y_train: Fold training target (log-transformed).
+            X_val: Fold validation features.
+            y_val: Fold validation target (log-transformed).
 
-            y_pred = model.predict(X_val)
-            y_val_orig = np.expm1(y_val)
-            y_pred_orig = np.expm1(y_pred)
+        Returns:
+            RMSE, MAE and R2 on the original price scale.
+        """
+        model = model_cls(**params)
+        model.fit(X_train, y_train)
 
-            scores["rmse"].append(np.sqrt(mean_squared_error(y_val_orig, y_pred_orig)))
-            scores["mae"].append(mean_absolute_error(y_val_orig, y_pred_orig))
-            scores["r2"].append(r2_score(y_val_orig, y_pred_orig))
+        y_pred = model.predict(X_val)
+        y_val_orig = np.expm1(y_val)
+        y_pred_orig = np.expm1(y_pred)
 
-        return {
-            f"cv_{metric}_mean": np.mean(values)
-            for metric, values in scores.items()
-        }
+        return (
+            np.sqrt(mean_squared_error(y_val_orig, y_pred_orig)),
+            mean_absolute_error(y_val_orig, y_pred_orig),
+            r2_score(y_val_orig, y_pred_orig)
+        )
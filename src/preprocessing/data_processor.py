@@ -13,6 +13,7 @@ from sklearn.pipeline import Pipeline
 import joblib
 from pathlib import Path
 
+from src.utils.persistence import atomic_dump
 from .feature_engineer import FeatureEngineer
 
 
@@ -66,12 +67,36 @@ class DataProcessor:
         "Fin": 3, "RFn": 2, "Unf": 1, "NA": 0, np.nan: 0
     }
 
+    # Ordinal mapping for each quality-related column
+    ORDINAL_MAPPINGS = {
+        **dict.fromkeys(
+            ["ExterQual", "ExterCond", "BsmtQual", "BsmtCond",
+             "HeatingQC", "KitchenQual", "FireplaceQu",
+             "GarageQual", "GarageCond", "PoolQC"],
+            QUALITY_MAPPING
+        ),
+        "BsmtExposure": BASEMENT_EXPOSURE_MAPPING,
+        "BsmtFinType1": BASEMENT_FINISH_MAPPING,
+        "BsmtFinType2": BASEMENT_FINISH_MAPPING,
+        "GarageFinish": GARAGE_FINISH_MAPPING,
+    }
+
+    # Feature matrices are single precision; tree models evaluate float32
+    OUTPUT_DTYPE = np.float32
+
     def __init__(self):
         self.feature_engineer = FeatureEngineer()
         self.numeric_imputer = SimpleImputer(strategy="median")
         self.categorical_imputer = SimpleImputer(strategy="constant", fill_value="None")
         self.scaler = StandardScaler()
         self.label_encoders: Dict[str, LabelEncoder] = {}
+        self._cat_maps: Dict[str, Dict[str, int]] = {}
+        self._numeric_cols: List[str] = []
+        self._categorical_cols: List[str] = []
+        self._ordinal_cols: List[str] = []
+        self._ordinal_luts: Dict[str, Tuple[pd.Index, np.ndarray]] = {}
+        self._numeric_keep: Optional[np.ndarray] = None
+        self._medians = self._mean = self._scale = None
         self.feature_names: List[str] = []
         self.is_fitted = False
 
@@ -102,15 +127,18 @@ class DataProcessor:
         # Add engineered features to numeric columns
         engineered_features = self.feature_engineer.get_created_features()
         numeric_cols.extend([f for f in engineered_features if f in df.columns])
-        numeric_cols = list(set(numeric_cols))
+        numeric_cols = list(dict.fromkeys(numeric_cols))
+        self._set_columns(numeric_cols, categorical_cols)
 
         # Fit numeric imputer and scaler
         if numeric_cols:
             numeric_data = df[numeric_cols].copy()
-            numeric_data = self._apply_ordinal_encoding(numeric_data)
+            if self._ordinal_cols:
+                numeric_data = self._apply_ordinal_encoding(numeric_data)
             self.numeric_imputer.fit(numeric_data)
             imputed_numeric = self.numeric_imputer.transform(numeric_data)
             self.scaler.fit(imputed_numeric)
+            self._cache_numeric_stats()
 
         # Fit label encoders for categorical columns
         for col in categorical_cols:
@@ -120,6 +148,7 @@ class DataProcessor:
                 values = df[col].fillna("None").astype(str)
                 le.fit(values)
                 self.label_encoders[col] = le
+        self._build_category_maps()
 
         # Store feature names
         self.feature_names = numeric_cols + categorical_cols
@@ -135,64 +164,47 @@ class DataProcessor:
             df: DataFrame to transform.
 
         Returns:
-            Transformed numpy array.
+            Transformed numpy array of OUTPUT_DTYPE (float32).
         """
         if not self.is_fitted:
             raise ValueError("Processor must be fitted before transform.")
 
-        df = df.copy()
-
-        # Apply feature engineering
+        # Apply feature engineering (returns a new frame; the input is untouched)
         df = self.feature_engineer.create_all_features(df)
 
-        # Get columns
-        numeric_cols = [c for c in self.NUMERIC_FEATURES if c in df.columns]
-        engineered_features = self.feature_engineer.get_created_features()
-        numeric_cols.extend([f for f in engineered_features if f in df.columns])
-        numeric_cols = list(set(numeric_cols))
-        categorical_cols = [c for c in self.CATEGORICAL_FEATURES if c in df.columns]
-
-        result_parts = []
-
-        # Process numeric columns
-        if numeric_cols:
-            numeric_data = df[numeric_cols].copy()
-            numeric_data = self._apply_ordinal_encoding(numeric_data)
-
-            # Handle missing columns
-            for col in numeric_cols:
-                if col not in numeric_data.columns:
-                    numeric_data[col] = 0
+        n_numeric = len(self._mean) if self._numeric_cols else 0
+        n_categorical = len(self._categorical_cols)
+        if not n_numeric and not n_categorical:
+            return np.array([], dtype=self.OUTPUT_DTYPE)
+
+        # Single output buffer filled column block by column block
+        out = np.empty((len(df), n_numeric + n_categorical), dtype=self.OUTPUT_DTYPE)
+
+        # Process numeric columns in fit order; missing columns become 0
+        if n_numeric:
+            numeric_data = df.reindex(columns=self._numeric_cols, fill_value=0)
+            if self._ordinal_cols:
+                numeric_data = self._apply_ordinal_encoding(numeric_data)
+
+            # Impute medians and standardize in place on a single array
+            X = numeric_data.to_numpy(dtype=np.float64, copy=True)
+            if self._numeric_keep is not None:
+                X = X[:, self._numeric_keep]
+            np.copyto(X, self._medians, where=np.isnan(X))
+            X -= self._mean
+            X /= self._scale
+            out[:, :n_numeric] = X
+
+        # Process categorical columns straight into their output columns
+        for j, col in enumerate(self._categorical_cols, start=n_numeric):
+            if col in df.columns:
+                # Handle unseen categories (encoded as 0)
+                values = df[col].fillna("None").astype(str)
+                out[:, j] = values.map(self._cat_maps[col]).fillna(0).to_numpy()
+            else:
+                out[:, j] = 0
 
-            imputed_numeric = self.numeric_imputer.transform(numeric_data)
-            scaled_numeric = self.scaler.transform(imputed_numeric)
-            result_parts.append(scaled_numeric)
-
-        # Process categorical columns
-        if categorical_cols:
-            categorical_data = []
-            for col in categorical_cols:
-                if col in df.columns:
-                    values = df[col].fillna("None").astype(str)
-                    # Handle unseen categories
-                    le = self.label_encoders.get(col)
-                    if le:
-                        encoded = []
-                        for v in values:
-                            if v in le.classes_:
-                                encoded.append(le.transform([v])[0])
-                            else:
-                                encoded.append(0)  # Default for unseen categories
-                        categorical_data.append(encoded)
-                else:
-                    categorical_data.append([0] * len(df))
-
-            if categorical_data:
-                result_parts.append(np.array(categorical_data).T)
-
-        if result_parts:
-            return np.hstack(result_parts)
-        return np.array([])
+        return out
 
     def fit_transform(self, df: pd.DataFrame, target_col: str = "SalePrice") -> np.ndarray:
         """Fit and transform in one step."""
@@ -201,39 +213,35 @@ class DataProcessor:
 
     def _apply_ordinal_encoding(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply ordinal encoding to quality-related columns."""
-        df = df.copy()
-
-        # Quality columns
-        quality_cols = ["ExterQual", "ExterCond", "BsmtQual", "BsmtCond",
-                        "HeatingQC", "KitchenQual", "FireplaceQu",
-                        "GarageQual", "GarageCond", "PoolQC"]
-
-        for col in quality_cols:
+        encoded = {}
+        for col in self._ordinal_cols:
             if col in df.columns:
-                df[col] = df[col].map(self.QUALITY_MAPPING).fillna(0)
-
-        # Basement exposure
-        if "BsmtExposure" in df.columns:
-            df["BsmtExposure"] = df["BsmtExposure"].map(
-                self.BASEMENT_EXPOSURE_MAPPING
-            ).fillna(0)
-
-        # Basement finish type
-        for col in ["BsmtFinType1", "BsmtFinType2"]:
-            if col in df.columns:
-                df[col] = df[col].map(self.BASEMENT_FINISH_MAPPING).fillna(0)
-
-        # Garage finish
-        if "GarageFinish" in df.columns:
-            df["GarageFinish"] = df["GarageFinish"].map(
-                self.GARAGE_FINISH_MAPPING
-            ).fillna(0)
-
-        return df
+                # Unknown and missing values get code -1, i.e. the trailing 0
+                categories, lut = self._ordinal_luts[col]
+                codes = pd.Categorical(df[col], categories=categories).codes
+                encoded[col] = lut[codes]
+        # Replace all encoded columns in one step
+        return df.assign(**encoded)
+
+    def _set_columns(self, numeric_cols: List[str], categorical_cols: List[str]) -> None:
+        """Cache the fitted column lists used by transform."""
+        self._numeric_cols = list(numeric_cols)
+        self._categorical_cols = list(categorical_cols)
+        self._ordinal_cols = [c for c in self._numeric_cols if c in self.ORDINAL_MAPPINGS]
+
+        # Category index and code -> value lookup table per ordinal column
+        self._ordinal_luts = {}
+        for col in self._ordinal_cols:
+            mapping = {
+                k: v for k, v in self.ORDINAL_MAPPINGS[col].items()
+                if isinstance(k, str)
+            }
+            lut = np.array(list(mapping.values()) + [0], dtype=np.float64)
+            self._ordinal_luts[col] = (pd.Index(list(mapping)), lut)
 
     def save(self, path: Path) -> None:
-        """Save processor to disk."""
-        joblib.dump({
+        """Save processor to disk, replacing any existing file atomically."""
+        atomic_dump({
             "numeric_imputer": self.numeric_imputer,
             "categorical_imputer": self.categorical_imputer,
             "scaler": self.scaler,
@@ -244,15 +252,41 @@ class DataProcessor:
 
     def load(self, path: Path) -> "DataProcessor":
         """Load processor from disk."""
-        data = joblib.load(path)
+        data = joblib.load(path, mmap_mode="r")
         self.numeric_imputer = data["numeric_imputer"]
         self.categorical_imputer = data["categorical_imputer"]
         self.scaler = data["scaler"]
         self.label_encoders = data["label_encoders"]
         self.feature_names = data["feature_names"]
         self.is_fitted = data["is_fitted"]
+        self._build_category_maps()
+
+        # Recover fit-time column order from the fitted transformers
+        self._set_columns(
+            getattr(self.numeric_imputer, "feature_names_in_", []),
+            list(self.label_encoders)
+        )
+        if self._numeric_cols:
+            self._cache_numeric_stats()
         return self
 
+    def _cache_numeric_stats(self) -> None:
+        """Cache imputer and scaler statistics for the fused transform."""
+        statistics = self.numeric_imputer.statistics_
+        # The imputer drops columns that were entirely missing during fit
+        keep = ~np.isnan(statistics)
+        self._numeric_keep = None if keep.all() else np.flatnonzero(keep)
+        self._medians = statistics[keep]
+        self._mean = self.scaler.mean_
+        self._scale = self.scaler.scale_
+
+    def _build_category_maps(self) -> None:
+        """Build category -> code lookups from the fitted label encoders."""
+        self._cat_maps = {
+            col: {cls: code for code, cls in enumerate(le.classes_)}
+            for col, le in self.label_encoders.items()
+        }
+
     def get_feature_names(self) -> List[str]:
         """Return list of feature names after transformation."""
         return self.feature_names
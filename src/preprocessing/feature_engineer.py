@@ -5,7 +5,8 @@ Handles creation of derived features and domain-specific transformations.
 
 import numpy as np
 import pandas as pd
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
 
 
 class FeatureEngineer:
@@ -14,190 +15,227 @@ class FeatureEngineer:
     Creates domain-specific features to improve model performance.
     """
 
+    # Raw columns read by the feature steps
+    SOURCE_COLUMNS = (
+        "YearBuilt", "YearRemodAdd", "GarageYrBlt", "TotalBsmtSF", "1stFlrSF",
+        "2ndFlrSF", "GrLivArea", "LotArea", "TotRmsAbvGrd", "OverallQual",
+        "OverallCond", "FullBath", "HalfBath", "BsmtFullBath", "BsmtHalfBath",
+        "BedroomAbvGr", "GarageCars", "GarageArea", "BsmtFinSF1", "BsmtFinSF2",
+        "OpenPorchSF", "EnclosedPorch", "3SsnPorch", "ScreenPorch", "PoolArea",
+        "Fireplaces", "WoodDeckSF", "MiscVal"
+    )
+
+    # Source columns whose missing values always mean zero
+    ZERO_FILL_COLUMNS = frozenset({
+        "FullBath", "HalfBath", "BsmtFullBath", "BsmtHalfBath", "BsmtFinSF1",
+        "BsmtFinSF2", "OpenPorchSF", "EnclosedPorch", "3SsnPorch", "ScreenPorch"
+    })
+
+    # Indicator columns only hold 0/1, so one byte per row is enough
+    FLAG_DTYPE = np.int8
+
+    # Source columns and derived values are computed in single precision
+    VALUE_DTYPE = np.float32
+
     def __init__(self):
-        self.created_features: List[str] = []
+        # Insertion-ordered set of every feature name created so far
+        self.created_features: Dict[str, None] = {}
 
     def create_all_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply all feature engineering transformations.
 
+        Source columns are pulled out once as NumPy arrays, every derived
+        feature is computed on arrays into a single dict, and the new
+        columns are attached with one assign.
+
         Args:
             df: Input DataFrame with raw features.
 
         Returns:
-            DataFrame with engineered features.
+            DataFrame with engineered features (empty inputs are returned
+            unchanged).
         """
-        df = df.copy()
-
-        # Apply all feature engineering steps
-        df = self._create_age_features(df)
-        df = self._create_area_features(df)
-        df = self._create_quality_features(df)
-        df = self._create_bathroom_features(df)
-        df = self._create_garage_features(df)
-        df = self._create_basement_features(df)
-        df = self._create_porch_features(df)
-        df = self._create_interaction_features(df)
-        df = self._create_binary_features(df)
-
-        return df
-
-    def _create_age_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        if len(df.index) == 0:
+            return df
+
+        # Only the source columns present in this schema are extracted; the
+        # steps below check availability against this dict. float32 halves
+        # the bytes touched and holds years, counts and areas exactly.
+        # Columns that are only ever used zero-filled get filled here too.
+        arrs = {
+            col: df[col].to_numpy(
+                dtype=self.VALUE_DTYPE,
+                na_value=0.0 if col in self.ZERO_FILL_COLUMNS else np.nan
+            )
+            for col in self._sources_for(frozenset(df.columns))
+        }
+        new: Dict[str, np.ndarray] = {}
+
+        # Apply all feature engineering steps (pandas-style inf/NaN on /0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._create_age_features(arrs, new)
+            self._create_area_features(arrs, new)
+            self._create_quality_features(arrs, new)
+            self._create_bathroom_features(arrs, new)
+            self._create_garage_features(arrs, new)
+            self._create_basement_features(arrs, new)
+            self._create_porch_features(arrs, new)
+            self._create_interaction_features(arrs, new)
+            self._create_binary_features(arrs, new)
+
+        self.created_features.update(dict.fromkeys(new))
+        # assign returns a new frame sharing the input's columns, so the
+        # caller's DataFrame is left untouched without a deep copy
+        return df.assign(**new)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _sources_for(columns: frozenset) -> Tuple[str, ...]:
+        """Source columns present in an input schema, cached per column set."""
+        return tuple(col for col in FeatureEngineer.SOURCE_COLUMNS if col in columns)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _bath_weights(bath_cols: Tuple[str, ...]) -> np.ndarray:
+        """Weight vector for the available bathroom columns (half baths count 0.5)."""
+        weights = np.array([0.5 if "Half" in col else 1.0 for col in bath_cols], dtype=np.float32)
+        weights.flags.writeable = False
+        return weights
+
+    @staticmethod
+    def _divide_nonzero(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """Divide, treating zero denominators as 1 (like denominator.replace(0, 1))."""
+        out = np.array(numerator, dtype=np.result_type(numerator, denominator, 1.0))
+        np.divide(out, denominator, out=out, where=denominator != 0)
+        return out
+
+    @staticmethod
+    def _fill(values: np.ndarray, fill_value: float) -> np.ndarray:
+        """Replace missing values, like Series.fillna."""
+        return np.where(np.isnan(values), fill_value, values)
+
+    def _create_age_features(self, arrs: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> None:
         """Create age-related features."""
         current_year = 2024
 
-        if "YearBuilt" in df.columns:
-            df["HouseAge"] = current_year - df["YearBuilt"]
-            self.created_features.append("HouseAge")
-
-        if "YearRemodAdd" in df.columns:
-            df["RemodAge"] = current_year - df["YearRemodAdd"]
-            self.created_features.append("RemodAge")
+        if "YearBuilt" in arrs:
+            new["HouseAge"] = current_year - arrs["YearBuilt"]
 
-        if "YearBuilt" in df.columns and "YearRemodAdd" in df.columns:
-            df["YearsSinceRemod"] = df["YearRemodAdd"] - df["YearBuilt"]
-            df["IsRemodeled"] = (df["YearRemodAdd"] != df["YearBuilt"]).astype(int)
-            self.created_features.extend(["YearsSinceRemod", "IsRemodeled"])
+        if "YearRemodAdd" in arrs:
+            new["RemodAge"] = current_year - arrs["YearRemodAdd"]
 
-        if "GarageYrBlt" in df.columns:
-            df["GarageAge"] = current_year - df["GarageYrBlt"].fillna(current_year)
-            self.created_features.append("GarageAge")
+        if "YearBuilt" in arrs and "YearRemodAdd" in arrs:
+            new["YearsSinceRemod"] = arrs["YearRemodAdd"] - arrs["YearBuilt"]
+            new["IsRemodeled"] = (arrs["YearRemodAdd"] != arrs["YearBuilt"]).astype(self.FLAG_DTYPE)
 
-        return df
+        if "GarageYrBlt" in arrs:
+            new["GarageAge"] = current_year - self._fill(arrs["GarageYrBlt"], current_year)
 
-    def _create_area_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _create_area_features(self, arrs: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> None:
         """Create area-related features."""
+        # Above ground area is shared by TotalSF and TotalAbvGrdSF
+        above_ground = None
+        if "1stFlrSF" in arrs and "2ndFlrSF" in arrs:
+            above_ground = arrs["1stFlrSF"] + arrs["2ndFlrSF"]
+
         # Total square footage
-        sf_cols = ["TotalBsmtSF", "1stFlrSF", "2ndFlrSF"]
-        if all(col in df.columns for col in sf_cols):
-            df["TotalSF"] = df["TotalBsmtSF"].fillna(0) + df["1stFlrSF"] + df["2ndFlrSF"]
-            self.created_features.append("TotalSF")
+        if "TotalBsmtSF" in arrs and above_ground is not None:
+            new["TotalSF"] = self._fill(arrs["TotalBsmtSF"], 0) + above_ground
 
         # Living area ratio
-        if "GrLivArea" in df.columns and "LotArea" in df.columns:
-            df["LivAreaRatio"] = df["GrLivArea"] / (df["LotArea"] + 1)
-            self.created_features.append("LivAreaRatio")
+        if "GrLivArea" in arrs and "LotArea" in arrs:
+            new["LivAreaRatio"] = arrs["GrLivArea"] / (arrs["LotArea"] + 1)
 
         # Above ground living area
-        if "1stFlrSF" in df.columns and "2ndFlrSF" in df.columns:
-            df["TotalAbvGrdSF"] = df["1stFlrSF"] + df["2ndFlrSF"]
-            self.created_features.append("TotalAbvGrdSF")
+        if above_ground is not None:
+            new["TotalAbvGrdSF"] = above_ground
 
         # Average room size
-        if "GrLivArea" in df.columns and "TotRmsAbvGrd" in df.columns:
-            df["AvgRoomSize"] = df["GrLivArea"] / (df["TotRmsAbvGrd"] + 1)
-            self.created_features.append("AvgRoomSize")
-
-        return df
+        if "GrLivArea" in arrs and "TotRmsAbvGrd" in arrs:
+            new["AvgRoomSize"] = arrs["GrLivArea"] / (arrs["TotRmsAbvGrd"] + 1)
 
-    def _create_quality_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _create_quality_features(self, arrs: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> None:
         """Create quality-related features."""
         # Overall quality score
-        if "OverallQual" in df.columns and "OverallCond" in df.columns:
-            df["OverallScore"] = df["OverallQual"] * df["OverallCond"]
-            df["QualCondDiff"] = df["OverallQual"] - df["OverallCond"]
-            self.created_features.extend(["OverallScore", "QualCondDiff"])
+        if "OverallQual" in arrs and "OverallCond" in arrs:
+            new["OverallScore"] = arrs["OverallQual"] * arrs["OverallCond"]
+            new["QualCondDiff"] = arrs["OverallQual"] - arrs["OverallCond"]
 
         # Quality per square foot
-        if "OverallQual" in df.columns and "GrLivArea" in df.columns:
-            df["QualPerSF"] = df["OverallQual"] / (df["GrLivArea"] / 1000)
-            self.created_features.append("QualPerSF")
+        if "OverallQual" in arrs and "GrLivArea" in arrs:
+            new["QualPerSF"] = arrs["OverallQual"] / (arrs["GrLivArea"] / 1000)
 
-        return df
-
-    def _create_bathroom_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _create_bathroom_features(self, arrs: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> None:
         """Create bathroom-related features."""
         bath_cols = ["FullBath", "HalfBath", "BsmtFullBath", "BsmtHalfBath"]
-        available_cols = [col for col in bath_cols if col in df.columns]
+        available_cols = tuple(col for col in bath_cols if col in arrs)
 
         if available_cols:
-            df["TotalBaths"] = sum(
-                df[col].fillna(0) * (0.5 if "Half" in col else 1)
-                for col in available_cols
-            )
-            self.created_features.append("TotalBaths")
+            # Half baths count as 0.5; one matrix-vector product sums them all
+            baths = np.column_stack([arrs[col] for col in available_cols])
+            weights = self._bath_weights(available_cols)
+            new["TotalBaths"] = baths @ weights
 
         # Bathrooms per bedroom
-        if "TotalBaths" in df.columns and "BedroomAbvGr" in df.columns:
-            df["BathPerBed"] = df["TotalBaths"] / (df["BedroomAbvGr"] + 1)
-            self.created_features.append("BathPerBed")
+        if "TotalBaths" in new and "BedroomAbvGr" in arrs:
+            new["BathPerBed"] = new["TotalBaths"] / (arrs["BedroomAbvGr"] + 1)
 
-        return df
-
-    def _create_garage_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _create_garage_features(self, arrs: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> None:
         """Create garage-related features."""
-        if "GarageCars" in df.columns and "GarageArea" in df.columns:
-            df["GarageAreaPerCar"] = df["GarageArea"] / (df["GarageCars"].replace(0, 1))
-            df["HasGarage"] = (df["GarageCars"] > 0).astype(int)
-            self.created_features.extend(["GarageAreaPerCar", "HasGarage"])
-
-        return df
+        if "GarageCars" in arrs and "GarageArea" in arrs:
+            cars = arrs["GarageCars"]
+            new["GarageAreaPerCar"] = self._divide_nonzero(arrs["GarageArea"], cars)
+            new["HasGarage"] = (cars > 0).astype(self.FLAG_DTYPE)
 
-    def _create_basement_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _create_basement_features(self, arrs: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> None:
         """Create basement-related features."""
-        if "TotalBsmtSF" in df.columns:
-            df["HasBasement"] = (df["TotalBsmtSF"] > 0).astype(int)
-            self.created_features.append("HasBasement")
+        if "TotalBsmtSF" in arrs:
+            new["HasBasement"] = (arrs["TotalBsmtSF"] > 0).astype(self.FLAG_DTYPE)
 
-        bsmt_fin_cols = ["BsmtFinSF1", "BsmtFinSF2"]
-        if all(col in df.columns for col in bsmt_fin_cols) and "TotalBsmtSF" in df.columns:
-            df["TotalBsmtFinSF"] = df["BsmtFinSF1"].fillna(0) + df["BsmtFinSF2"].fillna(0)
-            df["BsmtFinRatio"] = df["TotalBsmtFinSF"] / (df["TotalBsmtSF"].replace(0, 1))
-            self.created_features.extend(["TotalBsmtFinSF", "BsmtFinRatio"])
+        if "BsmtFinSF1" in arrs and "BsmtFinSF2" in arrs and "TotalBsmtSF" in arrs:
+            total_bsmt = arrs["TotalBsmtSF"]
+            new["TotalBsmtFinSF"] = arrs["BsmtFinSF1"] + arrs["BsmtFinSF2"]
+            new["BsmtFinRatio"] = self._divide_nonzero(new["TotalBsmtFinSF"], total_bsmt)
 
-        return df
-
-    def _create_porch_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _create_porch_features(self, arrs: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> None:
         """Create porch-related features."""
         porch_cols = ["OpenPorchSF", "EnclosedPorch", "3SsnPorch", "ScreenPorch"]
-        available_cols = [col for col in porch_cols if col in df.columns]
+        available_cols = [col for col in porch_cols if col in arrs]
 
         if available_cols:
-            df["TotalPorchSF"] = sum(df[col].fillna(0) for col in available_cols)
-            df["HasPorch"] = (df["TotalPorchSF"] > 0).astype(int)
-            self.created_features.extend(["TotalPorchSF", "HasPorch"])
-
-        return df
+            porches = np.column_stack([arrs[col] for col in available_cols])
+            new["TotalPorchSF"] = porches.sum(axis=1)
+            new["HasPorch"] = (new["TotalPorchSF"] > 0).astype(self.FLAG_DTYPE)
 
-    def _create_interaction_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _create_interaction_features(self, arrs: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> None:
         """Create interaction features between important variables."""
         # Age * Quality interaction
-        if "HouseAge" in df.columns and "OverallQual" in df.columns:
-            df["AgeQualInteraction"] = df["HouseAge"] * df["OverallQual"]
-            self.created_features.append("AgeQualInteraction")
+        if "HouseAge" in new and "OverallQual" in arrs:
+            new["AgeQualInteraction"] = new["HouseAge"] * arrs["OverallQual"]
 
         # Area * Quality interaction
-        if "GrLivArea" in df.columns and "OverallQual" in df.columns:
-            df["AreaQualInteraction"] = df["GrLivArea"] * df["OverallQual"]
-            self.created_features.append("AreaQualInteraction")
+        if "GrLivArea" in arrs and "OverallQual" in arrs:
+            new["AreaQualInteraction"] = arrs["GrLivArea"] * arrs["OverallQual"]
 
         # Neighborhood quality proxy
-        if "TotalSF" in df.columns and "OverallQual" in df.columns:
-            df["SFQualProduct"] = df["TotalSF"] * df["OverallQual"]
-            self.created_features.append("SFQualProduct")
+        if "TotalSF" in new and "OverallQual" in arrs:
+            new["SFQualProduct"] = new["TotalSF"] * arrs["OverallQual"]
 
-        return df
-
-    def _create_binary_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _create_binary_features(self, arrs: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> None:
         """Create binary indicator features."""
-        if "PoolArea" in df.columns:
-            df["HasPool"] = (df["PoolArea"] > 0).astype(int)
-            self.created_features.append("HasPool")
-
-        if "Fireplaces" in df.columns:
-            df["HasFireplace"] = (df["Fireplaces"] > 0).astype(int)
-            self.created_features.append("HasFireplace")
+        if "PoolArea" in arrs:
+            new["HasPool"] = (arrs["PoolArea"] > 0).astype(self.FLAG_DTYPE)
 
-        if "WoodDeckSF" in df.columns:
-            df["HasDeck"] = (df["WoodDeckSF"] > 0).astype(int)
-            self.created_features.append("HasDeck")
+        if "Fireplaces" in arrs:
+            new["HasFireplace"] = (arrs["Fireplaces"] > 0).astype(self.FLAG_DTYPE)
 
-        if "MiscVal" in df.columns:
-            df["HasMiscFeature"] = (df["MiscVal"] > 0).astype(int)
-            self.created_features.append("HasMiscFeature")
+        if "WoodDeckSF" in arrs:
+            new["HasDeck"] = (arrs["WoodDeckSF"] > 0).astype(self.FLAG_DTYPE)
 
-        return df
+        if "MiscVal" in arrs:
+            new["HasMiscFeature"] = (arrs["MiscVal"] > 0).astype(self.FLAG_DTYPE)
 
     def get_created_features(self) -> List[str]:
         """Return list of created feature names."""
-        return list(set(self.created_features))
+        return list(self.created_features)
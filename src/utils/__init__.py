@@ -1,6 +1,15 @@
 """Utility modules for ValorVista."""
 
 from .report_generator import ReportGenerator
-from .visualizations import create_feature_importance_chart, create_price_distribution
 
 __all__ = ["ReportGenerator", "create_feature_importance_chart", "create_price_distribution"]
+
+# Chart helpers pull in matplotlib, so they are imported on first use
+_LAZY_CHARTS = {"create_feature_importance_chart", "create_price_distribution"}
+
+
+def __getattr__(name):
+    if name in _LAZY_CHARTS:
+        from . import visualizations
+        return getattr(visualizations, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,93 @@
+"""
+Artifact Persistence Module for ValorVista.
+Writes model files so that running processes can keep reading old ones.
+"""
+
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import joblib
+
+
+def _replace_atomically(path: Union[str, Path], write: Callable[[Path], None]) -> None:
+    """
+    Write a file next to its destination, then move it into place.
+
+    os.replace swaps the directory entry in one step, so readers see either
+    the old file or the complete new one. Processes that memory-mapped the
+    old file keep its inode, which is never truncated or rewritten.
+
+    Args:
+        path: Destination file path.
+        write: Function writing the full contents to the given temp path.
+    """
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_dump(obj: Any, path: Union[str, Path]) -> None:
+    """
+    Pickle an object with joblib, replacing any existing file atomically.
+
+    Args:
+        obj: Object to save.
+        path: Destination file path.
+    """
+    _replace_atomically(path, lambda temp_path: joblib.dump(obj, temp_path))
+
+
+def model_version_path(model_path: Union[str, Path]) -> Path:
+    """Return the path of the version stamp kept next to a model file."""
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.name}.version")
+
+
+def model_importance_path(model_path: Union[str, Path]) -> Path:
+    """Return the path of the feature importances saved next to a model file."""
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.name}.importances.joblib")
+
+
+def write_model_version(model_path: Union[str, Path]) -> str:
+    """
+    Stamp a model with a new version once all of its files are saved.
+
+    The stamp is written last, so a changed stamp means the model and its
+    processor are both complete and belong together.
+
+    Args:
+        model_path: Path of the saved model.
+
+    Returns:
+        The new version string.
+    """
+    version = uuid.uuid4().hex
+    _replace_atomically(
+        model_version_path(model_path),
+        lambda temp_path: temp_path.write_text(version)
+    )
+    return version
+
+
+def read_model_version(model_path: Union[str, Path]) -> Optional[str]:
+    """
+    Read a model's version stamp.
+
+    Args:
+        model_path: Path of the saved model.
+
+    Returns:
+        The version string, or None for models saved without a stamp.
+    """
+    try:
+        return model_version_path(model_path).read_text().strip() or None
+    except FileNotFoundError:
+        return None
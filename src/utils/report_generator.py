@@ -4,13 +4,15 @@ Creates professional valuation reports.
 """
 
 import io
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
@@ -18,30 +20,74 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
-from .visualizations import create_feature_importance_chart, create_price_distribution
+
+# Table styles are fixed, so they are parsed once at import
+_META_TABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#888888')),
+    ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#333333')),
+    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+])
+
+_DETAILS_TABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#333333')),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F5F5F5')),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E0E0E0')),
+])
+
+_FACTORS_TABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#333333')),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1976D2')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E0E0E0')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
+    ('ALIGN', (2, 0), (2, -1), 'CENTER'),
+])
+
+
+# Charts embedded in the report: figure size in inches, drawn 6.5in wide
+_REPORT_CHART_SIZES = {
+    'price_distribution': (10, 4),
+    'feature_importance': (10, 6),
+}
+_REPORT_CHART_WIDTH = 6.5 * inch
 
 
 class ReportGenerator:
     """Generate professional PDF valuation reports."""
 
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        # Styles are read-only once built, so every generator shares one sheet
+        self.styles = self._build_styles()
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _build_styles() -> StyleSheet1:
+        """Build the sample stylesheet plus the report's custom styles once."""
+        styles = getSampleStyleSheet()
 
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles."""
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             'CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=24,
             spaceAfter=30,
             textColor=colors.HexColor('#1976D2'),
             alignment=TA_CENTER
         ))
 
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             'SectionHeader',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=14,
             spaceBefore=20,
             spaceAfter=10,
@@ -50,17 +96,16 @@ class ReportGenerator:
             borderPadding=0
         ))
 
-        self.styles.add(ParagraphStyle(
-            'BodyText',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=8,
-            textColor=colors.HexColor('#555555')
-        ))
+        # The sample sheet already defines 'BodyText'; adjust it in place
+        # rather than adding a duplicate name (which raises KeyError)
+        body = styles['BodyText']
+        body.fontSize = 10
+        body.spaceAfter = 8
+        body.textColor = colors.HexColor('#555555')
 
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             'PriceHighlight',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=28,
             alignment=TA_CENTER,
             textColor=colors.HexColor('#1976D2'),
@@ -68,14 +113,48 @@ class ReportGenerator:
             spaceAfter=10
         ))
 
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             'FooterText',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=8,
             textColor=colors.HexColor('#888888'),
             alignment=TA_CENTER
         ))
 
+        styles.add(ParagraphStyle(
+            'Subtitle',
+            parent=styles['Normal'],
+            fontSize=12,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#666666')
+        ))
+
+        styles.add(ParagraphStyle(
+            'Label',
+            parent=styles['Normal'],
+            fontSize=10,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#666666')
+        ))
+
+        styles.add(ParagraphStyle(
+            'Interval',
+            parent=styles['Normal'],
+            fontSize=10,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#888888')
+        ))
+
+        styles.add(ParagraphStyle(
+            'Disclaimer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor('#888888'),
+            alignment=TA_LEFT
+        ))
+
+        return styles
+
     def generate_report(
         self,
         property_data: Dict[str, Any],
@@ -97,8 +176,10 @@ class ReportGenerator:
         Returns:
             Path to generated PDF.
         """
+        # Render into memory and write the finished PDF in one call
+        buffer = io.BytesIO()
         doc = SimpleDocTemplate(
-            str(output_path),
+            buffer,
             pagesize=letter,
             rightMargin=0.75*inch,
             leftMargin=0.75*inch,
@@ -112,9 +193,7 @@ class ReportGenerator:
         story.append(Paragraph("ValorVista", self.styles['CustomTitle']))
         story.append(Paragraph(
             "AI-Powered Property Valuation Report",
-            ParagraphStyle('Subtitle', parent=self.styles['Normal'],
-                          fontSize=12, alignment=TA_CENTER,
-                          textColor=colors.HexColor('#666666'))
+            self.styles['Subtitle']
         ))
         story.append(Spacer(1, 20))
 
@@ -130,14 +209,7 @@ class ReportGenerator:
             ['Report ID:', output_path.stem.split('_')[-1]],
         ]
         meta_table = Table(meta_data, colWidths=[1.5*inch, 4*inch])
-        meta_table.setStyle(TableStyle([
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#888888')),
-            ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#333333')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-        ]))
+        meta_table.setStyle(_META_TABLE_STYLE)
         story.append(meta_table)
         story.append(Spacer(1, 20))
 
@@ -153,9 +225,7 @@ class ReportGenerator:
         pred_value = prediction['predictions'][0]
         story.append(Paragraph(
             f"<b>Estimated Market Value</b>",
-            ParagraphStyle('Label', parent=self.styles['Normal'],
-                          fontSize=10, alignment=TA_CENTER,
-                          textColor=colors.HexColor('#666666'))
+            self.styles['Label']
         ))
         story.append(Paragraph(
             f"${pred_value:,.0f}",
@@ -167,9 +237,7 @@ class ReportGenerator:
             interval = prediction['prediction_intervals'][0]
             story.append(Paragraph(
                 f"95% Confidence Range: {interval['formatted']['lower']} - {interval['formatted']['upper']}",
-                ParagraphStyle('Interval', parent=self.styles['Normal'],
-                              fontSize=10, alignment=TA_CENTER,
-                              textColor=colors.HexColor('#888888'))
+                self.styles['Interval']
             ))
         story.append(Spacer(1, 20))
 
@@ -183,15 +251,7 @@ class ReportGenerator:
 
         property_details = self._format_property_details(property_data)
         details_table = Table(property_details, colWidths=[2.5*inch, 2*inch, 2.5*inch])
-        details_table.setStyle(TableStyle([
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#333333')),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F5F5F5')),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E0E0E0')),
-        ]))
+        details_table.setStyle(_DETAILS_TABLE_STYLE)
         story.append(details_table)
         story.append(Spacer(1, 20))
 
@@ -206,30 +266,31 @@ class ReportGenerator:
         if explanation.get('key_factors'):
             factors_data = [['Feature', 'Value', 'Impact']]
             for factor in explanation['key_factors'][:8]:
-                impact_pct = f"{factor['importance']*100:.1f}%"
                 factors_data.append([
                     factor['feature'],
                     str(factor['value']),
-                    impact_pct
+                    factor['importance_pct']
                 ])
 
             factors_table = Table(factors_data, colWidths=[2.5*inch, 2*inch, 1.5*inch])
-            factors_table.setStyle(TableStyle([
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#333333')),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1976D2')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E0E0E0')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F5F5F5')]),
-                ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-            ]))
+            factors_table.setStyle(_FACTORS_TABLE_STYLE)
             story.append(factors_table)
 
         story.append(Spacer(1, 20))
 
+        # Charts Section
+        charts = self._render_charts(prediction, feature_importance)
+        if charts:
+            story.append(Paragraph("Valuation Charts", self.styles['SectionHeader']))
+            story.append(HRFlowable(
+                width="100%", thickness=1,
+                color=colors.HexColor('#1976D2')
+            ))
+            story.append(Spacer(1, 10))
+            for chart in charts:
+                story.append(chart)
+                story.append(Spacer(1, 10))
+
         # Disclaimer
         story.append(Spacer(1, 30))
         story.append(HRFlowable(
@@ -245,11 +306,7 @@ class ReportGenerator:
         market conditions, property condition, and other factors not captured in this analysis.
         We recommend consulting with a licensed real estate professional for accurate property valuations.
         """
-        story.append(Paragraph(disclaimer, ParagraphStyle(
-            'Disclaimer', parent=self.styles['Normal'],
-            fontSize=8, textColor=colors.HexColor('#888888'),
-            alignment=TA_LEFT
-        )))
+        story.append(Paragraph(disclaimer, self.styles['Disclaimer']))
 
         story.append(Spacer(1, 20))
         story.append(Paragraph(
@@ -259,8 +316,78 @@ class ReportGenerator:
 
         # Build PDF
         doc.build(story)
+        output_path.write_bytes(buffer.getvalue())
         return output_path
 
+    @staticmethod
+    def generate_reports_batch(
+        jobs: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[Path]:
+        """
+        Generate several reports in parallel worker processes.
+
+        PDF layout is CPU-bound Python, so independent reports are spread
+        across processes rather than threads.
+
+        Args:
+            jobs: Keyword arguments for generate_report, one dict per report.
+            max_workers: Number of worker processes (defaults to CPU count).
+
+        Returns:
+            Paths to the generated PDFs, in job order.
+        """
+        if len(jobs) <= 1:
+            return [_build_one(job) for job in jobs]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_build_one, jobs))
+
+    @staticmethod
+    def _render_charts(
+        prediction: Dict[str, Any],
+        feature_importance: List[Dict[str, Any]]
+    ) -> List[Image]:
+        """
+        Render the report's charts in parallel as PNG images.
+
+        Args:
+            prediction: Prediction results with intervals.
+            feature_importance: Feature importance data.
+
+        Returns:
+            Image flowables, price range first.
+        """
+        # Imported here so matplotlib only loads once a report is built
+        from .visualizations import render_report_charts
+
+        spec: Dict[str, Dict[str, Any]] = {}
+        intervals = prediction.get('prediction_intervals')
+        if intervals:
+            spec['price_distribution'] = {
+                'predicted_price': prediction['predictions'][0],
+                'lower_bound': intervals[0]['lower'],
+                'upper_bound': intervals[0]['upper'],
+            }
+        if feature_importance:
+            spec['feature_importance'] = {'feature_importance': feature_importance}
+        for name, kwargs in spec.items():
+            kwargs.update(
+                figsize=_REPORT_CHART_SIZES[name],
+                image_format='png',
+                return_base64=False
+            )
+
+        images = []
+        for name, data in render_report_charts(spec).items():
+            width, height = _REPORT_CHART_SIZES[name]
+            images.append(Image(
+                io.BytesIO(data),
+                width=_REPORT_CHART_WIDTH,
+                height=_REPORT_CHART_WIDTH * height / width
+            ))
+        return images
+
     def _format_property_details(self, data: Dict[str, Any]) -> List[List[str]]:
         """Format property data into table rows."""
         details = [
@@ -279,3 +406,8 @@ class ReportGenerator:
              f"Fireplaces: {data.get('Fireplaces', 0)}"],
         ]
         return details
+
+
+def _build_one(job: Dict[str, Any]) -> Path:
+    """Generate a single report; module-level so worker processes can run it."""
+    return ReportGenerator().generate_report(**job)
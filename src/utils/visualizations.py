@@ -4,32 +4,248 @@ Creates charts and plots for analysis and reports.
 """
 
 import io
+import os
 import base64
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union
 
 import numpy as np
-import pandas as pd
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend for server
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib.style
+from matplotlib.colors import Normalize
+from matplotlib.ticker import FuncFormatter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from cachetools import LRUCache
+
+try:
+    # SIMD base64 encoder; the stdlib codec is used when it is not installed
+    from pybase64 import b64encode_as_string
+except ImportError:
+    def b64encode_as_string(data: Union[bytes, memoryview]) -> str:
+        """Base64-encode a bytes-like object to an ASCII string."""
+        return base64.b64encode(data).decode('ascii')
+
+
+# Chart style, resolved and applied once at import instead of re-reading
+# the stylesheet for every chart
+PLOT_STYLE: Dict[str, Any] = {
+    **matplotlib.style.library['seaborn-v0_8-whitegrid'],
+    'figure.facecolor': 'white',
+    'axes.facecolor': 'white',
+    'font.family': 'sans-serif',
+    'font.size': 10,
+    # Fixed salt so SVG element ids (and thus output) are reproducible
+    'svg.hashsalt': 'valorvista',
+}
+
+
+# Colormap lookup tables (one RGBA row per colormap entry), built once
+_BLUES_LUT = matplotlib.colormaps['Blues'](np.arange(256))
+_RDYLGN_LUT = matplotlib.colormaps['RdYlGn'](np.arange(256))
+
+
+def _lookup_colors(lut: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Map values in [0, 1] to RGBA rows of a LUT, as Colormap.__call__ does."""
+    index = (np.asarray(values, dtype=np.float64) * len(lut)).astype(np.intp)
+    return lut[np.clip(index, 0, len(lut) - 1)]
+
+
+def _box_stats(data: np.ndarray, whis: float = 1.5) -> List[Dict[str, Any]]:
+    """
+    Compute Axes.bxp statistics for every column of a 2-D array at once.
+
+    Quartiles, whiskers and fliers follow cbook.boxplot_stats, but come
+    from one percentile call over all columns instead of a loop per column.
+
+    Args:
+        data: Array with one column per box.
+        whis: Whisker reach as a multiple of the interquartile range.
+
+    Returns:
+        One statistics dict per column.
+    """
+    q1, med, q3 = np.percentile(data, [25, 50, 75], axis=0)
+    reach = whis * (q3 - q1)
+
+    # Whiskers end at the most extreme data inside the reach, never inside the box
+    whislo = np.minimum(np.where(data >= q1 - reach, data, np.inf).min(axis=0), q1)
+    whishi = np.maximum(np.where(data <= q3 + reach, data, -np.inf).max(axis=0), q3)
+    outside = (data < whislo) | (data > whishi)
+
+    return [
+        {'med': med[i], 'q1': q1[i], 'q3': q3[i], 'whislo': whislo[i],
+         'whishi': whishi[i], 'fliers': data[outside[:, i], i]}
+        for i in range(data.shape[1])
+    ]
 
 
 def setup_plot_style():
-    """Setup consistent plot styling."""
-    plt.style.use('seaborn-v0_8-whitegrid')
-    plt.rcParams['figure.facecolor'] = 'white'
-    plt.rcParams['axes.facecolor'] = 'white'
-    plt.rcParams['font.family'] = 'sans-serif'
-    plt.rcParams['font.size'] = 10
+    """
+    Apply the chart style to matplotlib's process-wide rcParams.
+
+    The style is global rather than per chart because rc_context saves and
+    restores the shared rcParams, which races when charts render on several
+    threads. It is not applied on import; the application calls this once
+    at startup, so every figure in the process sees the same defaults
+    regardless of which chart or report is drawn first.
+    """
+    matplotlib.rcParams.update(PLOT_STYLE)
+
+
+# Rendered charts keyed by their (frozen) arguments
+_chart_cache: LRUCache = LRUCache(maxsize=128)
+_chart_cache_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts/lists into hashable tuples for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _memoize_chart(func: Callable[..., Union[str, bytes]]) -> Callable[..., Union[str, bytes]]:
+    """
+    Cache a chart function's output by its arguments.
+
+    Charts are pure functions of their inputs, so repeated requests (e.g.
+    the feature importance chart of a deployed model) reuse the encoded
+    image instead of rendering it again.
+    """
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Union[str, bytes]:
+        try:
+            key = (func.__name__, _freeze(args), _freeze(kwargs))
+            with _chart_cache_lock:
+                cached = _chart_cache.get(key)
+        except TypeError:
+            # Unhashable or unsortable input (e.g. an array, or dict keys
+            # of mixed types); render without caching
+            return func(*args, **kwargs)
+        if cached is not None:
+            return cached
+
+        result = func(*args, **kwargs)
+        with _chart_cache_lock:
+            _chart_cache[key] = result
+        return result
+
+    return wrapper
+
+
+# Per-thread figures keyed by size, reused across charts
+_figures = threading.local()
+
+# Per-thread output buffer for encoded images
+_buffers = threading.local()
+
+
+def _get_figure(figsize: Tuple[int, int]) -> Figure:
+    """
+    Return a cleared figure of the given size.
+
+    Figures are built on an Agg canvas without pyplot, so nothing is
+    registered globally, and are reused by the same thread between charts.
+
+    Args:
+        figsize: Figure size tuple.
+
+    Returns:
+        Empty figure ready for new axes.
+    """
+    cache = getattr(_figures, 'by_size', None)
+    if cache is None:
+        cache = _figures.by_size = {}
+
+    key = tuple(figsize)
+    fig = cache.get(key)
+    if fig is None:
+        fig = Figure(figsize=key)
+        FigureCanvasAgg(fig)
+        cache[key] = fig
+    else:
+        fig.clf()
+    return fig
+
+
+# Raster resolution. Charts are shown scaled down to roughly 500px wide,
+# so 72 dpi keeps them sharp while encoding about half the pixels of 100.
+CHART_DPI = 72
+
+# Encoder options per output format. PNG charts are flat colors, so fast
+# zlib compression costs little in size; timestamp/software tags are
+# dropped to keep the output deterministic.
+_SAVE_OPTIONS: Dict[str, Dict[str, Any]] = {
+    'png': {
+        'metadata': {'Software': None},
+        'pil_kwargs': {'compress_level': 1, 'optimize': False},
+    },
+    # Method 1 is the fastest lossless setting that still compresses well;
+    # method 0 can come out larger than the PNG
+    'webp': {
+        'pil_kwargs': {'lossless': True, 'quality': 0, 'method': 1},
+    },
+    'svg': {
+        'metadata': {'Date': None},
+    },
+}
+
+_MIME_TYPES = {'png': 'image/png', 'webp': 'image/webp', 'svg': 'image/svg+xml'}
+
+
+def _save_image(
+    fig: Figure,
+    image_format: str = 'png',
+    as_data_uri: bool = True
+) -> Union[str, bytes]:
+    """
+    Render a figure and clear it.
 
+    Args:
+        fig: Figure to render.
+        image_format: 'png', 'webp' or 'svg'.
+        as_data_uri: Return a base64 data URI instead of the raw bytes.
 
+    Returns:
+        Base64 encoded image data URI, or the raw image bytes.
+    """
+    if image_format not in _SAVE_OPTIONS:
+        raise ValueError(f"Unsupported image format: {image_format}")
+
+    # Reuse this thread's output buffer rather than allocating one per chart
+    buffer = getattr(_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _buffers.buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate()
+
+    fig.savefig(buffer, format=image_format, dpi=CHART_DPI,
+                facecolor='white', edgecolor='none', **_SAVE_OPTIONS[image_format])
+    fig.clf()
+    if not as_data_uri:
+        return buffer.getvalue()
+
+    # Encode straight from the buffer's memory instead of copying it out;
+    # the view is released before the buffer is reused
+    with buffer.getbuffer() as view:
+        data = b64encode_as_string(view)
+    return f"data:{_MIME_TYPES[image_format]};base64,{data}"
+
+
+@_memoize_chart
 def create_feature_importance_chart(
     feature_importance: List[Dict[str, Any]],
     top_n: int = 10,
     figsize: Tuple[int, int] = (10, 6),
-    return_base64: bool = True
-) -> str:
+    return_base64: bool = True,
+    image_format: str = 'svg'
+) -> Union[str, bytes]:
     """
     Create horizontal bar chart of feature importance.
 
@@ -37,23 +253,23 @@ def create_feature_importance_chart(
         feature_importance: List of dicts with 'feature' and 'importance' keys.
         top_n: Number of top features to display.
         figsize: Figure size tuple.
-        return_base64: Whether to return base64 encoded image.
+        return_base64: Return a base64 data URI; otherwise the raw image bytes.
+        image_format: 'svg' (default, vector), 'png' or 'webp'.
 
     Returns:
-        Base64 encoded PNG image string or file path.
+        Base64 encoded image data URI, or the raw image bytes.
     """
-    setup_plot_style()
-
     # Prepare data
     data = feature_importance[:top_n]
     features = [d['feature'] for d in data][::-1]
     importance = [d['importance'] for d in data][::-1]
 
     # Create figure
-    fig, ax = plt.subplots(figsize=figsize)
+    fig = _get_figure(figsize)
+    ax = fig.subplots()
 
     # Color gradient
-    colors = plt.cm.Blues(np.linspace(0.4, 0.8, len(features)))
+    colors = _lookup_colors(_BLUES_LUT, np.linspace(0.4, 0.8, len(features)))
 
     # Create bars
     bars = ax.barh(features, importance, color=colors, edgecolor='none')
@@ -63,9 +279,7 @@ def create_feature_importance_chart(
     ax.set_title('Top Feature Importance', fontsize=14, fontweight='bold', pad=20)
 
     # Add value labels
-    for bar, imp in zip(bars, importance):
-        ax.text(bar.get_width() + 0.002, bar.get_y() + bar.get_height()/2,
-                f'{imp:.3f}', va='center', fontsize=9)
+    ax.bar_label(bars, fmt='{:.3f}', padding=3, fontsize=9)
 
     # Clean up
     ax.spines['top'].set_visible(False)
@@ -73,28 +287,20 @@ def create_feature_importance_chart(
     ax.spines['left'].set_visible(False)
     ax.tick_params(left=False)
 
-    plt.tight_layout()
-
-    if return_base64:
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{image_base64}"
+    fig.tight_layout()
 
-    plt.close(fig)
-    return ""
+    return _save_image(fig, image_format, as_data_uri=return_base64)
 
 
+@_memoize_chart
 def create_price_distribution(
     predicted_price: float,
     lower_bound: float,
     upper_bound: float,
     figsize: Tuple[int, int] = (10, 4),
-    return_base64: bool = True
-) -> str:
+    return_base64: bool = True,
+    image_format: str = 'svg'
+) -> Union[str, bytes]:
     """
     Create price prediction visualization with confidence interval.
 
@@ -103,14 +309,14 @@ def create_price_distribution(
         lower_bound: Lower confidence bound.
         upper_bound: Upper confidence bound.
         figsize: Figure size tuple.
-        return_base64: Whether to return base64 encoded image.
+        return_base64: Return a base64 data URI; otherwise the raw image bytes.
+        image_format: 'svg' (default, vector), 'png' or 'webp'.
 
     Returns:
-        Base64 encoded PNG image string.
+        Base64 encoded image data URI, or the raw image bytes.
     """
-    setup_plot_style()
-
-    fig, ax = plt.subplots(figsize=figsize)
+    fig = _get_figure(figsize)
+    ax = fig.subplots()
 
     # Create a simple visualization
     margin = (upper_bound - lower_bound) * 0.2
@@ -142,56 +348,50 @@ def create_price_distribution(
     # Remove axes
     ax.axis('off')
 
-    plt.tight_layout()
-
-    if return_base64:
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{image_base64}"
+    fig.tight_layout()
 
-    plt.close(fig)
-    return ""
+    return _save_image(fig, image_format, as_data_uri=return_base64)
 
 
+@_memoize_chart
 def create_neighborhood_heatmap(
     neighborhood_prices: Dict[str, float],
     figsize: Tuple[int, int] = (12, 8),
-    return_base64: bool = True
-) -> str:
+    return_base64: bool = True,
+    image_format: str = 'svg'
+) -> Union[str, bytes]:
     """
     Create heatmap of neighborhood average prices.
 
     Args:
         neighborhood_prices: Dictionary mapping neighborhoods to avg prices.
         figsize: Figure size tuple.
-        return_base64: Whether to return base64 encoded image.
+        return_base64: Return a base64 data URI; otherwise the raw image bytes.
+        image_format: 'svg' (default, vector), 'png' or 'webp'.
 
     Returns:
-        Base64 encoded PNG image string.
+        Base64 encoded image data URI, or the raw image bytes.
     """
-    setup_plot_style()
+    # Sort ascending by price (bars are drawn bottom-up, so the most
+    # expensive neighborhood ends up on top)
+    names = np.array(list(neighborhood_prices.keys()))
+    prices = np.fromiter(neighborhood_prices.values(), dtype=np.float64,
+                         count=len(neighborhood_prices))
+    order = np.argsort(-prices, kind='stable')[::-1]
+    names = names[order]
+    prices = prices[order]
 
-    # Sort by price
-    sorted_hoods = sorted(neighborhood_prices.items(), key=lambda x: x[1], reverse=True)
-    names = [x[0] for x in sorted_hoods]
-    prices = [x[1] for x in sorted_hoods]
+    fig = _get_figure(figsize)
+    ax = fig.subplots()
 
-    fig, ax = plt.subplots(figsize=figsize)
+    # Create color scale; the sorted ends are the min and max
+    norm = Normalize(prices[0], prices[-1])
+    colors = _lookup_colors(_RDYLGN_LUT, norm(prices))
 
-    # Create color scale
-    norm = plt.Normalize(min(prices), max(prices))
-    colors = plt.cm.RdYlGn(norm(prices))
-
-    bars = ax.barh(names[::-1], prices[::-1], color=colors[::-1])
+    bars = ax.barh(names, prices, color=colors)
 
     # Add labels
-    for bar, price in zip(bars, prices[::-1]):
-        ax.text(bar.get_width() + 1000, bar.get_y() + bar.get_height()/2,
-                f'${price:,.0f}', va='center', fontsize=9)
+    ax.bar_label(bars, fmt='${:,.0f}', padding=4, fontsize=9)
 
     ax.set_xlabel('Average Price', fontsize=12, fontweight='bold')
     ax.set_title('Average Home Prices by Neighborhood', fontsize=14, fontweight='bold', pad=20)
@@ -199,27 +399,19 @@ def create_neighborhood_heatmap(
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-
-    if return_base64:
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{image_base64}"
+    fig.tight_layout()
 
-    plt.close(fig)
-    return ""
+    return _save_image(fig, image_format, as_data_uri=return_base64)
 
 
+@_memoize_chart
 def create_property_comparison(
     target_property: Dict[str, Any],
     comparable_properties: List[Dict[str, Any]],
     figsize: Tuple[int, int] = (12, 6),
-    return_base64: bool = True
-) -> str:
+    return_base64: bool = True,
+    image_format: str = 'webp'
+) -> Union[str, bytes]:
     """
     Create comparison chart between target and comparable properties.
 
@@ -227,37 +419,43 @@ def create_property_comparison(
         target_property: Target property data.
         comparable_properties: List of comparable property data.
         figsize: Figure size tuple.
-        return_base64: Whether to return base64 encoded image.
+        return_base64: Return a base64 data URI; otherwise the raw image bytes.
+        image_format: 'webp' (default), 'png' or 'svg'.
 
     Returns:
-        Base64 encoded PNG image string.
+        Base64 encoded image data URI, or the raw image bytes.
     """
-    setup_plot_style()
-
     # Features to compare
     features = ['GrLivArea', 'OverallQual', 'YearBuilt', 'TotalBsmtSF', 'GarageCars']
     feature_labels = ['Living Area\n(sq ft)', 'Quality\n(1-10)', 'Year Built',
                      'Basement\n(sq ft)', 'Garage\n(cars)']
 
-    fig, axes = plt.subplots(1, len(features), figsize=figsize)
-
-    for i, (feat, label) in enumerate(zip(features, feature_labels)):
-        ax = axes[i]
-
-        # Get values
-        target_val = target_property.get(feat, 0)
-        comp_vals = [p.get(feat, 0) for p in comparable_properties]
-
-        # Plot comparables as box plot
-        if comp_vals:
-            bp = ax.boxplot([comp_vals], positions=[0], widths=0.6)
-            for element in ['boxes', 'whiskers', 'fliers', 'caps', 'medians']:
-                plt.setp(bp[element], color='#90CAF9')
-            plt.setp(bp['boxes'], facecolor='#E3F2FD')
-            plt.setp(bp['medians'], color='#1976D2')
+    fig = _get_figure(figsize)
+    axes = fig.subplots(1, len(features), squeeze=False)[0]
+
+    # Box statistics for every feature from one 2-D array (one column each)
+    box_stats = None
+    if comparable_properties:
+        comp_array = np.array(
+            [[p.get(feat, 0) for feat in features] for p in comparable_properties],
+            dtype=float
+        )
+        box_stats = _box_stats(comp_array)
+
+    for i, (ax, feat, label) in enumerate(zip(axes, features, feature_labels)):
+        # Plot comparables from the precomputed stats
+        if box_stats is not None:
+            ax.bxp(
+                [box_stats[i]], positions=[0], widths=0.6, patch_artist=True,
+                boxprops={'edgecolor': '#90CAF9', 'facecolor': '#E3F2FD'},
+                whiskerprops={'color': '#90CAF9'},
+                capprops={'color': '#90CAF9'},
+                flierprops={'color': '#90CAF9'},
+                medianprops={'color': '#1976D2'}
+            )
 
         # Plot target
-        ax.scatter([0], [target_val], s=100, color='#D32F2F', zorder=5,
+        ax.scatter([0], [target_property.get(feat, 0)], s=100, color='#D32F2F', zorder=5,
                   marker='*', label='Your Property' if i == 0 else '')
 
         ax.set_title(label, fontsize=10, fontweight='bold')
@@ -265,28 +463,20 @@ def create_property_comparison(
 
     axes[0].legend(loc='upper left', fontsize=8)
 
-    fig.suptitle('Property Comparison Analysis', fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
+    fig.suptitle('Property Comparison Analysis', fontsize=14, fontweight='bold')
+    fig.tight_layout()
 
-    if return_base64:
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{image_base64}"
-
-    plt.close(fig)
-    return ""
+    return _save_image(fig, image_format, as_data_uri=return_base64)
 
 
+@_memoize_chart
 def create_trend_forecast(
     historical_prices: List[Tuple[int, float]],
     forecast_years: int = 3,
     figsize: Tuple[int, int] = (10, 5),
-    return_base64: bool = True
-) -> str:
+    return_base64: bool = True,
+    image_format: str = 'svg'
+) -> Union[str, bytes]:
     """
     Create trend and forecast visualization.
 
@@ -294,40 +484,38 @@ def create_trend_forecast(
         historical_prices: List of (year, price) tuples.
         forecast_years: Number of years to forecast.
         figsize: Figure size tuple.
-        return_base64: Whether to return base64 encoded image.
+        return_base64: Return a base64 data URI; otherwise the raw image bytes.
+        image_format: 'svg' (default, vector), 'png' or 'webp'.
 
     Returns:
-        Base64 encoded PNG image string.
+        Base64 encoded image data URI, or the raw image bytes.
     """
-    setup_plot_style()
-
-    years = [x[0] for x in historical_prices]
-    prices = [x[1] for x in historical_prices]
+    years = np.array([x[0] for x in historical_prices])
+    prices = np.array([x[1] for x in historical_prices], dtype=float)
 
     # Simple linear forecast
     if len(years) >= 2:
         slope = (prices[-1] - prices[0]) / (years[-1] - years[0])
-        forecast_years_list = list(range(years[-1] + 1, years[-1] + forecast_years + 1))
-        forecast_prices = [prices[-1] + slope * (y - years[-1]) for y in forecast_years_list]
+        forecast_years_arr = np.arange(years[-1] + 1, years[-1] + forecast_years + 1)
+        forecast_prices = prices[-1] + slope * (forecast_years_arr - years[-1])
     else:
-        forecast_years_list = []
-        forecast_prices = []
+        forecast_years_arr = np.array([], dtype=int)
+        forecast_prices = np.array([])
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig = _get_figure(figsize)
+    ax = fig.subplots()
 
     # Historical line
     ax.plot(years, prices, 'o-', color='#1976D2', linewidth=2,
             markersize=8, label='Historical')
 
     # Forecast line
-    if forecast_years_list:
-        ax.plot([years[-1]] + forecast_years_list, [prices[-1]] + forecast_prices,
+    if forecast_years_arr.size:
+        ax.plot(np.r_[years[-1], forecast_years_arr], np.r_[prices[-1], forecast_prices],
                 'o--', color='#F57C00', linewidth=2, markersize=8, label='Forecast')
 
         # Confidence band
-        upper = [p * 1.1 for p in forecast_prices]
-        lower = [p * 0.9 for p in forecast_prices]
-        ax.fill_between(forecast_years_list, lower, upper,
+        ax.fill_between(forecast_years_arr, forecast_prices * 0.9, forecast_prices * 1.1,
                        alpha=0.2, color='#F57C00')
 
     ax.set_xlabel('Year', fontsize=12, fontweight='bold')
@@ -336,21 +524,64 @@ def create_trend_forecast(
     ax.legend(loc='upper left')
 
     # Format y-axis as currency
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x/1000:.0f}K'))
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'${x/1000:.0f}K'))
 
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
+    fig.tight_layout()
+
+    return _save_image(fig, image_format, as_data_uri=return_base64)
+
+
+# Independent report charts render concurrently; Agg rasterization and
+# zlib release the GIL, and figures/buffers are already per thread
+_CHART_FUNCTIONS: Dict[str, Callable[..., Union[str, bytes]]] = {
+    'feature_importance': create_feature_importance_chart,
+    'price_distribution': create_price_distribution,
+    'neighborhood_heatmap': create_neighborhood_heatmap,
+    'property_comparison': create_property_comparison,
+    'trend_forecast': create_trend_forecast,
+}
+
+
+def _new_chart_executor() -> ThreadPoolExecutor:
+    """Create the thread pool used by render_report_charts."""
+    return ThreadPoolExecutor(
+        max_workers=min(len(_CHART_FUNCTIONS), os.cpu_count() or 1),
+        thread_name_prefix="chart"
+    )
+
+
+def _reset_chart_executor() -> None:
+    """Give a forked child its own pool; the parent's threads do not survive fork."""
+    global _chart_executor
+    _chart_executor = _new_chart_executor()
 
-    if return_base64:
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        plt.close(fig)
-        return f"data:image/png;base64,{image_base64}"
 
-    plt.close(fig)
-    return ""
+_chart_executor = _new_chart_executor()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_chart_executor)
+
+
+def render_report_charts(spec: Dict[str, Dict[str, Any]]) -> Dict[str, Union[str, bytes]]:
+    """
+    Render several charts in parallel.
+
+    Args:
+        spec: Mapping of chart name (e.g. 'feature_importance',
+            'price_distribution') to the keyword arguments for its
+            create_* function.
+
+    Returns:
+        Mapping of chart name to the rendered chart.
+    """
+    unknown = set(spec) - set(_CHART_FUNCTIONS)
+    if unknown:
+        raise ValueError(f"Unknown chart(s): {', '.join(sorted(unknown))}")
+
+    futures = {
+        name: _chart_executor.submit(_CHART_FUNCTIONS[name], **kwargs)
+        for name, kwargs in spec.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
@@ -198,6 +198,25 @@ const API = {
         });
     },
 
+    /**
+     * Poll until a queued report is ready
+     */
+    async waitForReport(reportId, interval = 1000, maxAttempts = 60) {
+        for (let attempt = 0; attempt < maxAttempts; attempt++) {
+            const result = await this.request(`/report/status/${reportId}`);
+
+            if (result.status === 'ready') {
+                return result;
+            }
+            if (result.status === 'failed') {
+                throw new Error(result.error || 'Report generation failed');
+            }
+
+            await new Promise(resolve => setTimeout(resolve, interval));
+        }
+        throw new Error('Report generation timed out');
+    },
+
     /**
      * Health check
      */
@@ -189,7 +189,14 @@ document.addEventListener('DOMContentLoaded', () => {
         Utils.setButtonLoading(btn, true);
 
         try {
-            const result = await API.generateReport(currentPropertyData);
+            const queued = await API.generateReport(currentPropertyData);
+
+            if (!queued.success) {
+                throw new Error(queued.error || 'Report generation failed');
+            }
+
+            // Reports are built in the background; wait until it is ready
+            const result = await API.waitForReport(queued.report_id);
 
             if (result.success && result.download_url) {
                 // Trigger download
@@ -2,6 +2,8 @@
 API Endpoint Tests for ValorVista
 """
 
+import os
+import time
 import pytest
 import json
 from pathlib import Path
@@ -41,6 +43,76 @@ def sample_property():
     }
 
 
+class TestPropertyInput:
+    """Test property input validation."""
+
+    def test_omitted_lot_area_defaults_to_none(self, sample_property):
+        """Test that a missing LotArea is left unset rather than defaulted."""
+        from src.api.validators import PropertyInput
+
+        assert PropertyInput(**sample_property).LotArea is None
+
+
+class TestPredictorReload:
+    """Test reloading the predictor when the model is retrained."""
+
+    def test_reload_keyed_on_version_stamp(self, tmp_path):
+        """Test that only a new version stamp swaps in a new predictor."""
+        from src.api.routes import _predictor_for
+        from src.utils.persistence import atomic_dump, write_model_version
+        from tests.test_models import train_model
+
+        trainer, model_path, processor_path = train_model(tmp_path)
+        config = {
+            "MODEL_PATH": model_path,
+            "PREPROCESSOR_PATH": processor_path,
+            "PREDICTION_CACHE_SIZE": 16,
+            "PREDICTION_BATCH_SIZE": 4,
+            "PREDICTION_BATCH_WAIT_MS": 0.0,
+            "PREDICTION_DEVICE": "cpu",
+            "PREDICTION_GPU_MIN_BATCH": 32
+        }
+        predictor = _predictor_for(config)
+        assert _predictor_for(config) is predictor
+
+        # A half-finished save (model written, stamp not yet) is not picked up
+        atomic_dump(trainer.model, model_path)
+        assert _predictor_for(config) is predictor
+
+        write_model_version(model_path)
+        assert _predictor_for(config) is not predictor
+
+        # The replaced predictor's batching thread is stopped
+        assert predictor._batcher._closed
+
+    def test_unchanged_model_skips_lock(self, tmp_path, monkeypatch):
+        """Test that requests for an unchanged model do not take the lock."""
+        from src.api import routes
+        from tests.test_models import train_model
+
+        _, model_path, processor_path = train_model(tmp_path)
+        config = {
+            "MODEL_PATH": model_path,
+            "PREPROCESSOR_PATH": processor_path,
+            "PREDICTION_CACHE_SIZE": 16,
+            "PREDICTION_BATCH_SIZE": 4,
+            "PREDICTION_BATCH_WAIT_MS": 0.0,
+            "PREDICTION_DEVICE": "cpu",
+            "PREDICTION_GPU_MIN_BATCH": 32
+        }
+        predictor = routes._predictor_for(config)
+
+        class FailingLock:
+            def __enter__(self):
+                raise AssertionError("predictor lock taken")
+
+            def __exit__(self, *exc_info):
+                return False
+
+        monkeypatch.setattr(routes, "_predictor_lock", FailingLock())
+        assert routes._predictor_for(config) is predictor
+
+
 class TestHealthEndpoint:
     """Test health check endpoint."""
 
@@ -54,6 +126,22 @@ class TestHealthEndpoint:
         assert 'timestamp' in data
 
 
+class TestCors:
+    """Test CORS preflight handling."""
+
+    def test_preflight_cached(self, client):
+        """Test that API preflights are answered with a cacheable 204."""
+        response = client.options(
+            '/api/v1/predict',
+            headers={
+                'Origin': 'http://example.com',
+                'Access-Control-Request-Method': 'POST'
+            }
+        )
+        assert response.status_code == 204
+        assert response.headers['Access-Control-Max-Age'] == '86400'
+
+
 class TestPredictEndpoint:
     """Test prediction endpoint."""
 
@@ -88,6 +176,15 @@ class TestBatchEndpoint:
         )
         assert response.status_code == 400
 
+    def test_batch_too_many_properties(self, client, sample_property):
+        """Test batch rejects more than the maximum number of properties."""
+        response = client.post(
+            '/api/v1/predict/batch',
+            data=json.dumps({"properties": [sample_property] * 101}),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+
 
 class TestFormOptionsEndpoint:
     """Test form options endpoint."""
@@ -103,6 +200,15 @@ class TestFormOptionsEndpoint:
         assert 'buildingTypes' in data['options']
         assert 'houseStyles' in data['options']
 
+    def test_options_not_modified(self, client):
+        """Test that a matching ETag returns 304 without a body."""
+        response = client.get('/api/v1/options')
+        etag = response.headers['ETag']
+
+        cached = client.get('/api/v1/options', headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert cached.data == b''
+
 
 class TestNeighborhoodsEndpoint:
     """Test neighborhoods endpoint."""
@@ -117,3 +223,122 @@ class TestNeighborhoodsEndpoint:
         assert 'neighborhoods' in data
         assert len(data['neighborhoods']) > 0
         assert 'NAmes' in data['neighborhoods']
+
+
+class TestJsonProvider:
+    """Test orjson-backed JSON serialization."""
+
+    def test_serializes_numpy_values(self, client):
+        """Test that numpy scalars and arrays are encoded natively."""
+        import numpy as np
+
+        app = client.application
+        body = app.json.dumps({"mean": np.float64(1.5), "values": np.array([1, 2])})
+
+        assert json.loads(body) == {"mean": 1.5, "values": [1, 2]}
+
+
+class TestChartEndpoint:
+    """Test chart image endpoint."""
+
+    def test_chart_unsupported_format(self, client):
+        """Test chart with an unknown image format."""
+        response = client.get('/api/v1/chart/feature-importance.gif')
+        assert response.status_code == 404
+
+        data = json.loads(response.data)
+        assert data['success'] is False
+
+
+class TestReportEndpoint:
+    """Test report generation endpoints."""
+
+    def test_report_missing_data(self, client):
+        """Test report generation with missing data."""
+        response = client.post(
+            '/api/v1/report',
+            data=json.dumps({}),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+
+    def test_report_status_unknown(self, client):
+        """Test status of a report that was never requested."""
+        response = client.get('/api/v1/report/status/deadbeef')
+        assert response.status_code == 404
+
+    def test_download_missing_report(self, client):
+        """Test downloading a report that does not exist."""
+        response = client.get('/api/v1/report/download/missing.pdf')
+        assert response.status_code == 404
+        assert response.get_json()['success'] is False
+
+
+class TestReportStatusAcrossWorkers:
+    """Test report status for jobs not owned by the answering worker."""
+
+    @pytest.fixture
+    def app(self, tmp_path):
+        """App writing reports to a temporary directory."""
+        app = create_app(TestingConfig())
+        app.config['TESTING'] = True
+        app.config['REPORTS_DIR'] = tmp_path
+        return app
+
+    @staticmethod
+    def staging_path(app, report_id):
+        from src.api.routes import _report_filename, _staging_path
+
+        path = _staging_path(app.config['REPORTS_DIR'] / _report_filename(report_id))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def test_failure_recorded_for_other_workers(self, app):
+        """Test that a failed build is reported as failed, not missing."""
+        from src.api.routes import _build_report, _report_filename
+
+        class FailingPredictor:
+            def predict(self, data):
+                raise ValueError('model exploded')
+
+        report_id = 'feedface'
+        self.staging_path(app, report_id).touch()
+        with pytest.raises(ValueError):
+            _build_report(
+                FailingPredictor(), {}, app.config['REPORTS_DIR'] / _report_filename(report_id)
+            )
+
+        data = app.test_client().get(f'/api/v1/report/status/{report_id}').get_json()
+        assert data['status'] == 'failed'
+        assert data['error'] == 'model exploded'
+
+    def test_abandoned_build_times_out(self, app):
+        """Test that a marker left by a killed worker stops reading as pending."""
+        from src.api.routes import REPORT_BUILD_TIMEOUT
+
+        fresh, stale = self.staging_path(app, 'aaaa1111'), self.staging_path(app, 'bbbb2222')
+        fresh.touch()
+        stale.touch()
+        started = time.time() - REPORT_BUILD_TIMEOUT - 1
+        os.utime(stale, (started, started))
+
+        client = app.test_client()
+        assert client.get('/api/v1/report/status/aaaa1111').get_json()['status'] == 'pending'
+        data = client.get('/api/v1/report/status/bbbb2222').get_json()
+        assert data['status'] == 'failed'
+        assert 'timed out' in data['error']
+
+    def test_submit_failure_removes_marker(self, app, sample_property, monkeypatch):
+        """Test that a job that could not be queued leaves no pending marker."""
+        from src.api import routes
+
+        def failing_submit(*args, **kwargs):
+            raise RuntimeError('cannot schedule new futures after shutdown')
+
+        monkeypatch.setattr(routes, 'get_predictor', lambda: object())
+        monkeypatch.setattr(routes._report_executor, 'submit', failing_submit)
+
+        response = app.test_client().post('/api/v1/report', json=sample_property)
+
+        assert response.status_code == 500
+        assert not list((app.config['REPORTS_DIR'] / '.partial').iterdir())
@@ -0,0 +1,381 @@
+"""
+Model Module Tests for ValorVista
+"""
+
+import os
+import pytest
+import pandas as pd
+import joblib
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import DynamicBatcher, ModelTrainer, HousePricePredictor
+from src.preprocessing import DataProcessor, FeatureEngineer
+from src.utils.persistence import model_importance_path
+
+
+def make_training_frame(n_rows: int = 120, seed: int = 0) -> pd.DataFrame:
+    """Create a small synthetic training set with a learnable price."""
+    rng = np.random.default_rng(seed)
+    area = rng.integers(800, 3000, n_rows)
+    quality = rng.integers(3, 10, n_rows)
+    year = rng.integers(1950, 2010, n_rows)
+    return pd.DataFrame({
+        'GrLivArea': area,
+        'OverallQual': quality,
+        'OverallCond': rng.integers(3, 9, n_rows),
+        'YearBuilt': year,
+        'YearRemodAdd': year,
+        'TotalBsmtSF': rng.integers(0, 1500, n_rows),
+        'LotArea': rng.integers(3000, 15000, n_rows),
+        'FullBath': rng.integers(1, 3, n_rows),
+        'GarageCars': rng.integers(0, 3, n_rows),
+        'YrSold': 2010,
+        'Neighborhood': rng.choice(['NAmes', 'OldTown', 'NridgHt'], n_rows),
+        'ExterQual': rng.choice(['Gd', 'TA', 'Ex'], n_rows),
+        'SalePrice': (20000 + area * 60 + quality * 9000 + (year - 1950) * 500
+                      + rng.normal(0, 5000, n_rows))
+    })
+
+
+def train_model(directory: Path, model_type: str = 'hist_gradient_boosting', seed: int = 0):
+    """Train a model on synthetic data and return its trainer and file paths."""
+    data_path = directory / f'train_{seed}.csv'
+    make_training_frame(seed=seed).to_csv(data_path, index=False)
+
+    trainer = ModelTrainer({'model_type': model_type})
+    model_path = directory / 'model.joblib'
+    processor_path = directory / 'processor.joblib'
+    trainer.train(data_path, model_path, processor_path)
+    return trainer, model_path, processor_path
+
+
+@pytest.fixture
+def sample_property():
+    """Sample property data for testing."""
+    return {
+        'GrLivArea': 1500,
+        'OverallQual': 7,
+        'OverallCond': 5,
+        'YearBuilt': 2005,
+        'TotalBsmtSF': 1000,
+        'GarageCars': 2,
+        'Neighborhood': 'NAmes',
+        'ExterQual': 'Gd'
+    }
+
+
+class TestModelPersistence:
+    """Test saving models that are being served."""
+
+    def test_retrain_keeps_loaded_model_valid(self, tmp_path, sample_property):
+        """Test that retraining does not rewrite files a predictor has mapped."""
+        _, model_path, processor_path = train_model(tmp_path)
+        predictor = HousePricePredictor(model_path, processor_path, batch_size=1)
+        expected = predictor.predict(sample_property, return_interval=False)
+        inodes = (model_path.stat().st_ino, processor_path.stat().st_ino)
+
+        train_model(tmp_path, seed=1)
+
+        # The old files must be replaced, not truncated under the memory map
+        assert model_path.stat().st_ino != inodes[0]
+        assert processor_path.stat().st_ino != inodes[1]
+        predictor._cache.clear()
+        assert predictor.predict(sample_property, return_interval=False) == expected
+        assert not list(tmp_path.glob('.*.tmp'))
+
+
+class TestDynamicBatcher:
+    """Test coalescing of concurrent single-item requests."""
+
+    @staticmethod
+    def double_all(batches):
+        """Return a batch function doubling items and recording each batch."""
+        def process(items):
+            batches.append(list(items))
+            if any(item < 0 for item in items):
+                raise ValueError('negative item')
+            return [item * 2 for item in items]
+        return process
+
+    def test_coalesces_concurrent_items(self):
+        """Test that items submitted together run as one batch."""
+        batches = []
+        batcher = DynamicBatcher(self.double_all(batches), max_batch_size=8, max_wait_ms=500)
+
+        futures = [batcher.submit(i) for i in range(8)]
+
+        assert [f.result(timeout=5) for f in futures] == [i * 2 for i in range(8)]
+        assert batches == [list(range(8))]
+        batcher.close()
+
+    def test_failed_item_does_not_fail_batch(self):
+        """Test that only the invalid item of a failed batch gets the error."""
+        batches = []
+        batcher = DynamicBatcher(self.double_all(batches), max_batch_size=3, max_wait_ms=500)
+
+        good, bad, other = batcher.submit(1), batcher.submit(-1), batcher.submit(2)
+
+        assert good.result(timeout=5) == 2
+        assert other.result(timeout=5) == 4
+        with pytest.raises(ValueError):
+            bad.result(timeout=5)
+        assert batches[0] == [1, -1, 2]
+        batcher.close()
+
+    def test_close_stops_worker(self):
+        """Test that closing stops the thread and later items still run."""
+        batcher = DynamicBatcher(self.double_all([]), max_wait_ms=1)
+        assert batcher.submit(1).result(timeout=5) == 2
+        worker = batcher._worker
+
+        batcher.close()
+        worker.join(timeout=5)
+
+        assert not worker.is_alive()
+        assert batcher.submit(3).result(timeout=5) == 6
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+    def test_worker_restarts_after_fork(self):
+        """Test that a forked child gets its own worker thread."""
+        batcher = DynamicBatcher(self.double_all([]), max_wait_ms=1)
+        assert batcher.submit(1).result(timeout=5) == 2
+
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                code = 0 if batcher.submit(3).result(timeout=5) == 6 else 1
+            finally:
+                os._exit(code)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        batcher.close()
+
+
+class TestPredictionIntervals:
+    """Test the staged-prediction spread behind prediction intervals."""
+
+    @pytest.mark.parametrize('model_type', ['gradient_boosting', 'hist_gradient_boosting'])
+    def test_staged_std_matches_staged_predict(self, tmp_path, model_type):
+        """Test the fast spread against the std of staged_predict's tail."""
+        _, model_path, processor_path = train_model(tmp_path, model_type)
+        predictor = HousePricePredictor(model_path, processor_path, batch_size=1)
+        X = predictor.processor.transform(
+            make_training_frame(20, seed=2).drop(columns=['SalePrice'])
+        )
+
+        stages = np.array(list(predictor.model.staged_predict(X)))
+        expected = stages[len(stages) // 2:].std(axis=0)
+        actual = predictor._staged_std(X, predictor.model.predict(X))
+
+        assert expected.max() > 0
+        assert np.allclose(actual, expected, rtol=1e-4, atol=1e-6)
+
+
+class StubForestInference:
+    """Stand-in for cuML's ForestInference, offsetting the CPU model."""
+
+    OFFSET = 0.5
+
+    def __init__(self, model, fail=False):
+        self.model = model
+        self.fail = fail
+        self.batch_sizes = []
+
+    def predict(self, X):
+        self.batch_sizes.append(X.shape[0])
+        if self.fail:
+            raise RuntimeError('device lost')
+        return (self.model.predict(X) + self.OFFSET).astype(np.float32)
+
+
+class TestGpuRouting:
+    """Test which batches are sent to the GPU model."""
+
+    @pytest.fixture
+    def predictor(self, tmp_path):
+        """Gradient boosting predictor with a stub GPU model."""
+        _, model_path, processor_path = train_model(tmp_path, 'gradient_boosting')
+        predictor = HousePricePredictor(
+            model_path, processor_path, batch_size=1, gpu_min_batch=10
+        )
+        predictor._gpu_model = StubForestInference(predictor.model)
+        return predictor
+
+    @staticmethod
+    def frame(n_rows):
+        return make_training_frame(n_rows, seed=4).drop(columns=['SalePrice'])
+
+    def test_large_batches_use_gpu(self, predictor):
+        """Test that batches from gpu_min_batch rows up go to the GPU."""
+        X = predictor.processor.transform(self.frame(12))
+
+        assert np.allclose(
+            predictor._predict_log(X),
+            predictor.model.predict(X) + StubForestInference.OFFSET
+        )
+        assert np.array_equal(predictor._predict_log(X[:9]), predictor.model.predict(X[:9]))
+        assert predictor._gpu_model.batch_sizes == [12]
+
+    def test_gpu_failure_falls_back_to_cpu(self, predictor):
+        """Test that a failing GPU model leaves predictions on the CPU."""
+        predictor._gpu_model.fail = True
+        X = predictor.processor.transform(self.frame(12))
+
+        assert np.array_equal(predictor._predict_log(X), predictor.model.predict(X))
+        assert predictor._gpu_model.batch_sizes == [12]
+
+    def test_missing_cuml_keeps_cpu(self, tmp_path, monkeypatch):
+        """Test that device="cuda" without cuML predicts on the CPU."""
+        monkeypatch.setitem(sys.modules, 'cuml', None)
+        _, model_path, processor_path = train_model(tmp_path, 'gradient_boosting')
+        predictor = HousePricePredictor(
+            model_path, processor_path, batch_size=1, device='cuda', gpu_min_batch=1
+        )
+
+        assert predictor._gpu_model is None
+        assert len(predictor.predict_batch(self.frame(3).to_dict('records'))) == 3
+
+    def test_interval_spread_matches_cpu_stages(self, predictor):
+        """Test that GPU-routed batches get the spread of the CPU stages."""
+        X = predictor.processor.transform(self.frame(12))
+        gpu_log = predictor._predict_log(X)
+
+        stages = np.array(list(predictor.model.staged_predict(X)))
+        expected = stages[len(stages) // 2:].std(axis=0)
+
+        assert np.allclose(predictor._staged_std(X, gpu_log), expected, rtol=1e-4, atol=1e-6)
+
+
+class TestFeaturePrecision:
+    """Test that single-precision features do not change valuations."""
+
+    @pytest.mark.parametrize('model_type', ['gradient_boosting', 'hist_gradient_boosting'])
+    def test_float32_matches_float64_features(self, tmp_path, monkeypatch, model_type):
+        """Test predictions from float32 and float64 features agree."""
+        _, model_path, processor_path = train_model(tmp_path, model_type)
+        predictor = HousePricePredictor(model_path, processor_path, batch_size=1)
+        df = make_training_frame(200, seed=3).drop(columns=['SalePrice'])
+
+        X32 = predictor.processor.transform(df)
+        monkeypatch.setattr(FeatureEngineer, 'VALUE_DTYPE', np.float64)
+        monkeypatch.setattr(DataProcessor, 'OUTPUT_DTYPE', np.float64)
+        X64 = predictor.processor.transform(df)
+
+        assert X32.dtype == np.float32 and X64.dtype == np.float64
+        assert np.allclose(X32, X64, rtol=1e-6, atol=1e-6)
+
+        prices32 = np.expm1(predictor.model.predict(X32))
+        prices64 = np.expm1(predictor.model.predict(X64))
+        # Tree splits sit on float32 training values; rounding may only flip
+        # rows lying exactly on a threshold, moving them to a neighbouring leaf
+        assert np.allclose(prices32, prices64, rtol=0.02)
+        if model_type == 'gradient_boosting':
+            # GradientBoostingRegressor evaluates its trees in float32 anyway
+            assert np.array_equal(prices32, prices64)
+
+
+class TestFeatureImportance:
+    """Test importances of models without built-in ones."""
+
+    def test_hist_gradient_boosting_importances(self, tmp_path, sample_property):
+        """Test permutation importances are normalized and explained."""
+        trainer, model_path, processor_path = train_model(tmp_path)
+        importances = trainer.importances
+
+        # Estimates are saved next to the model, not patched onto it
+        assert not hasattr(trainer.model, 'feature_importances_')
+        assert np.array_equal(joblib.load(model_importance_path(model_path)), importances)
+
+        assert np.all(np.isfinite(importances))
+        assert np.all(importances >= 0)
+        assert np.isclose(importances.sum(), 1.0)
+
+        predictor = HousePricePredictor(model_path, processor_path, batch_size=1)
+        explanation = predictor.explain_prediction(sample_property)
+
+        assert explanation['key_factors']
+        for factor in explanation['key_factors']:
+            assert factor['importance_pct'] == f"{factor['importance'] * 100:.1f}%"
+
+    def test_models_saved_without_importances(self, tmp_path):
+        """Test that older models fall back to their built-in importances."""
+        trainer, model_path, processor_path = train_model(tmp_path, 'gradient_boosting')
+        model_importance_path(model_path).unlink()
+
+        predictor = HousePricePredictor(model_path, processor_path, batch_size=1)
+        importances = [item['importance'] for item in predictor.get_feature_importance(100)]
+
+        assert sorted(importances) == sorted(trainer.model.feature_importances_.tolist())
+
+
+class TestPredictionCache:
+    """Test caching of single-property predictions."""
+
+    @pytest.fixture
+    def predictor(self, tmp_path, monkeypatch):
+        """Predictor that counts how often the model is run."""
+        _, model_path, processor_path = train_model(tmp_path)
+        predictor = HousePricePredictor(model_path, processor_path, batch_size=1)
+        predictor.model_calls = 0
+        predict_frame = predictor._predict_frame
+
+        def counting_predict_frame(*args, **kwargs):
+            predictor.model_calls += 1
+            return predict_frame(*args, **kwargs)
+
+        monkeypatch.setattr(predictor, '_predict_frame', counting_predict_frame)
+        return predictor
+
+    def test_repeated_input_hits_cache(self, predictor, sample_property):
+        """Test that the same property is only run through the model once."""
+        first = predictor.predict(dict(sample_property))
+        second = predictor.predict(dict(sample_property))
+
+        assert second == first
+        assert predictor.model_calls == 1
+
+    def test_mutating_result_keeps_cache_intact(self, predictor, sample_property):
+        """Test that changing a returned result does not change cached ones."""
+        first = predictor.predict(sample_property)
+        expected = predictor.predict(sample_property)
+        first['predictions'].append(0.0)
+        first['prediction_intervals'][0]['lower'] = 0.0
+
+        second = predictor.predict(sample_property)
+        second['extra'] = True
+
+        assert predictor.predict(sample_property) == expected
+        assert predictor.model_calls == 1
+
+    def test_key_order_does_not_matter(self, predictor, sample_property):
+        """Test that reordered keys map to the same cache entry."""
+        reordered = dict(reversed(list(sample_property.items())))
+        assert list(reordered) != list(sample_property)
+
+        predictor.predict(sample_property)
+        predictor.predict(reordered)
+
+        assert predictor.model_calls == 1
+        assert len(predictor._cache) == 1
+
+    def test_cache_key_includes_options(self, predictor, sample_property):
+        """Test that interval options are part of the cache key."""
+        predictor.predict(sample_property)
+        predictor.predict(sample_property, confidence=0.9)
+
+        assert predictor.model_calls == 2
+
+    def test_batch_and_frame_inputs_skip_cache(self, predictor, sample_property):
+        """Test that batch and DataFrame predictions are not cached."""
+        predictor.predict_batch([sample_property, sample_property])
+        predictor.predict(pd.DataFrame([sample_property]))
+        predictor.predict(pd.DataFrame([sample_property]))
+
+        assert predictor.model_calls == 3
+        assert len(predictor._cache) == 0
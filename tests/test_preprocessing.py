@@ -55,6 +55,7 @@ class TestFeatureEngineer:
 
         assert 'TotalSF' in result.columns
         assert 'LivAreaRatio' in result.columns
+        assert result['TotalSF'].dtype == np.float32
 
     def test_create_quality_features(self, sample_df):
         """Test quality feature creation."""
@@ -82,6 +83,14 @@ class TestFeatureEngineer:
         assert 'HasFireplace' in result.columns
         assert result['HasFireplace'].iloc[0] == 1
         assert result['HasFireplace'].iloc[2] == 0
+        assert result['HasFireplace'].dtype == np.int8
+
+    def test_input_not_modified(self, sample_df):
+        """Test that feature creation leaves the input DataFrame unchanged."""
+        original = sample_df.copy()
+        FeatureEngineer().create_all_features(sample_df)
+
+        pd.testing.assert_frame_equal(sample_df, original)
 
 
 class TestDataProcessor:
@@ -136,3 +145,32 @@ class TestDataProcessor:
         names = processor.get_feature_names()
         assert isinstance(names, list)
         assert len(names) > 0
+
+    def test_transform_unseen_category(self, sample_df):
+        """Test unseen categories are encoded as 0."""
+        processor = DataProcessor()
+        processor.fit(sample_df)
+
+        unseen = sample_df.copy()
+        unseen['Neighborhood'] = ['Unknown', 'CollgCr', 'Unknown']
+        result = processor.transform(unseen)
+
+        col = processor.get_feature_names().index('Neighborhood')
+        expected = processor.label_encoders['Neighborhood'].transform(['CollgCr'])[0]
+        assert list(result[:, col]) == [0, expected, 0]
+
+    def test_transform_empty(self, sample_df):
+        """Test transforming a DataFrame with no rows."""
+        processor = DataProcessor()
+        X = processor.fit_transform(sample_df)
+
+        X_empty = processor.transform(sample_df.iloc[:0])
+        assert X_empty.shape == (0, X.shape[1])
+
+    def test_transform_missing_column(self, sample_df):
+        """Test transform keeps the fitted width when a column is missing."""
+        processor = DataProcessor()
+        processor.fit(sample_df)
+
+        result = processor.transform(sample_df.drop(columns=['Fireplaces', 'MSZoning']))
+        assert result.shape == (3, len(processor.get_feature_names()))
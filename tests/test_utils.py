@@ -0,0 +1,159 @@
+"""
+Utility Module Tests for ValorVista
+"""
+
+import subprocess
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import ReportGenerator, visualizations
+
+
+@pytest.fixture
+def chart_spec():
+    """Keyword arguments for several report charts."""
+    return {
+        'price_distribution': {
+            'predicted_price': 200000,
+            'lower_bound': 180000,
+            'upper_bound': 220000,
+            'image_format': 'png',
+            'return_base64': False
+        },
+        'feature_importance': {
+            'feature_importance': [
+                {'feature': f'Feature{i}', 'importance': 1 / (i + 1)} for i in range(12)
+            ],
+            'image_format': 'png',
+            'return_base64': False
+        },
+        'trend_forecast': {
+            'historical_prices': [(2018, 180000), (2020, 195000), (2022, 215000)],
+            'return_base64': False
+        }
+    }
+
+
+class TestPlotStyle:
+    """Test when the chart style reaches matplotlib's global defaults."""
+
+    def test_import_leaves_rcparams_alone(self):
+        """Test that importing the chart module does not restyle matplotlib."""
+        code = (
+            "import matplotlib; before = dict(matplotlib.rcParams); "
+            "from src.utils import visualizations; "
+            "assert all(matplotlib.rcParams[k] == before[k] "
+            "for k in visualizations.PLOT_STYLE); "
+            "visualizations.setup_plot_style(); "
+            "assert matplotlib.rcParams['svg.hashsalt'] == 'valorvista'"
+        )
+        subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=Path(__file__).parent.parent, check=True
+        )
+
+
+class TestReportCharts:
+    """Test parallel chart rendering."""
+
+    def test_parallel_matches_sequential(self, chart_spec):
+        """Test that charts rendered on the pool match one-by-one rendering."""
+        visualizations._chart_cache.clear()
+        parallel = visualizations.render_report_charts(chart_spec)
+
+        visualizations._chart_cache.clear()
+        sequential = {
+            'price_distribution': visualizations.create_price_distribution(
+                **chart_spec['price_distribution']
+            ),
+            'feature_importance': visualizations.create_feature_importance_chart(
+                **chart_spec['feature_importance']
+            ),
+            'trend_forecast': visualizations.create_trend_forecast(
+                **chart_spec['trend_forecast']
+            )
+        }
+
+        assert parallel == sequential
+
+    def test_uncacheable_arguments_render(self):
+        """Test that arguments that cannot form a cache key bypass the cache."""
+        calls = []
+        chart = visualizations._memoize_chart(lambda data: calls.append(data) or 'chart')
+
+        assert chart({1: 'a', 'b': 2}) == 'chart'
+        assert chart([{'x': [1]}, {2: 'y', 'z': 3}]) == 'chart'
+        assert len(calls) == 2
+
+    def test_unknown_chart(self):
+        """Test that unknown chart names are rejected."""
+        with pytest.raises(ValueError):
+            visualizations.render_report_charts({'pie': {}})
+
+
+@pytest.fixture
+def report_job(tmp_path):
+    """Keyword arguments for generating one report."""
+    return {
+        'property_data': {
+            'GrLivArea': 1500, 'LotArea': 8000, 'OverallQual': 7, 'OverallCond': 5,
+            'YearBuilt': 2005, 'TotalBsmtSF': 1000, 'GarageCars': 2,
+            'Neighborhood': 'NAmes'
+        },
+        'prediction': {
+            'predictions': [200000.0],
+            'formatted_predictions': ['$200,000'],
+            'prediction_intervals': [{
+                'lower': 180000.0,
+                'upper': 220000.0,
+                'point_estimate': 200000.0,
+                'formatted': {
+                    'lower': '$180,000',
+                    'upper': '$220,000',
+                    'point_estimate': '$200,000'
+                }
+            }],
+            'confidence_level': 0.95
+        },
+        'explanation': {
+            'key_factors': [
+                {'feature': 'OverallQual', 'value': 7, 'importance': 0.4,
+                 'importance_pct': '40.0%'},
+                {'feature': 'GrLivArea', 'value': 1500, 'importance': 0.25,
+                 'importance_pct': '25.0%'}
+            ]
+        },
+        'feature_importance': [
+            {'feature': 'OverallQual', 'importance': 0.4},
+            {'feature': 'GrLivArea', 'importance': 0.25}
+        ],
+        'output_path': tmp_path / 'valuation_report_test.pdf'
+    }
+
+
+class TestReportGenerator:
+    """Test PDF report generation."""
+
+    def test_generate_report(self, report_job):
+        """Test that a complete PDF is written."""
+        path = ReportGenerator().generate_report(**report_job)
+
+        assert path == report_job['output_path']
+        data = path.read_bytes()
+        assert data.startswith(b'%PDF')
+        assert data.rstrip().endswith(b'%%EOF')
+
+    def test_generate_reports_batch(self, report_job, tmp_path):
+        """Test that batch generation writes every report in job order."""
+        jobs = [
+            {**report_job, 'output_path': tmp_path / f'valuation_report_{i}.pdf'}
+            for i in range(2)
+        ]
+
+        paths = ReportGenerator.generate_reports_batch(jobs, max_workers=2)
+
+        assert paths == [job['output_path'] for job in jobs]
+        assert all(path.read_bytes().startswith(b'%PDF') for path in paths)